@@ -75,21 +75,6 @@ def index() -> rx.Component:
     )
 
 
-def signin_page() -> rx.Component:
-    return clerk.clerk_provider(
-        rx.center(
-            rx.vstack(
-                clerk.sign_in(
-                    path="/signin",
-                ),
-                align="center",
-                spacing="7",
-            ),
-            height="100vh",
-        ),
-    )
-
-
 def auth_required_page():
     return clerk.clerk_provider(
         rx.center(
@@ -1,181 +1,545 @@
-import requests
+import asyncio
+import functools
+import threading
+import time
+from typing import AsyncIterator, Iterator, NamedTuple, Tuple, Type
+
+import httpx
+import orjson
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 from .clerk_request_models import *
 from .clerk_response_models import *
 
+# Validators for the endpoints that return plain dicts rather than a response model;
+# built once, as constructing a TypeAdapter compiles a new validator each time.
+_DICT_STR_STR_ADAPTER = pydantic.TypeAdapter(Dict[str, str])
+_DICT_STR_ANY_ADAPTER = pydantic.TypeAdapter(Dict[str, Any])
+_PAGINATION_META_ADAPTER = pydantic.TypeAdapter(PaginationMeta)
+
+
+class _CachedJWKS(NamedTuple):
+    fetched_at: float
+    jwks: JWKSResponse
+    keys: List[Dict[str, Any]]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter_for(request_model: type) -> pydantic.TypeAdapter:
+    return pydantic.TypeAdapter(request_model)
+
+
+def _dump(request: Any) -> Optional[Dict[str, Any]]:
+    # Only send the fields that were actually set; unset query parameters would otherwise
+    # be encoded literally as e.g. `?limit=None`.  List values are sent as repeated keys
+    # (`?user_id=a&user_id=b`), which is what the Clerk API expects.
+    if request is None:
+        return None
+    return _adapter_for(type(request)).dump_python(request, exclude_none=True)
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Connection pool settings shared by the sync and async clients.  Idle connections are
+# kept a little under Clerk's keep-alive timeout so they are not reused as they close.
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=85)
+_TIMEOUT = httpx.Timeout(5.0)
+
+# The largest `limit` the Clerk API accepts on its list endpoints.
+_MAX_PAGE_SIZE = 500
+
+# How many ids get_users_by_ids asks for per request.  Each id is sent as its own
+# `user_id=` query parameter (about 40 bytes), so this keeps URLs near 4 KB, well under
+# the 8 KB many proxies and servers allow, rather than the 20 KB a full page would need.
+_USER_ID_BATCH_SIZE = 100
+
+
+def _encode_body(data: Any, headers: Optional[Dict[str, str]]) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+    # Serialize request bodies straight to JSON bytes, rather than to a dict that the
+    # HTTP library would then have to encode again.
+    if data is None:
+        return None, headers
+    content = _adapter_for(type(data)).dump_json(data, exclude_none=True)
+    return content, {**headers, **_JSON_CONTENT_TYPE} if headers else _JSON_CONTENT_TYPE
+
+
+def _user_id_batches(user_ids: List[str]) -> List[GetUserListParams]:
+    user_ids = list(dict.fromkeys(user_ids))
+    return [GetUserListParams(user_id=user_ids[i:i + _USER_ID_BATCH_SIZE], limit=_USER_ID_BATCH_SIZE)
+            for i in range(0, len(user_ids), _USER_ID_BATCH_SIZE)]
+
+
+class _FieldSelection(object):
+    """
+    Decodes a paginated list response, keeping only the requested fields of each item.
+
+    Items are built with `model_construct`, so the selected values are not validated,
+    nested objects are left as plain dicts, and fields that were not selected hold the
+    model's default, or None for required fields.  `model_fields_set` on each item names the
+    fields that were selected and present in the response, which tells an unselected
+    field apart from one that is really None.  When pysimdjson is installed the body is
+    walked lazily and unselected fields are never materialized.
+    """
+
+    def __init__(self, list_model: Type[pydantic.BaseModel], item_model: Type[pydantic.BaseModel],
+                 fields: List[str]):
+        self.list_model = list_model
+        self.item_model = item_model
+        self.fields = list(fields)
+        self.__name__ = f"{list_model.__name__}[{', '.join(self.fields)}]"
+        # model_construct only fills in fields that have a default; required fields it
+        # isn't given would be left off the object, and reading them would raise.
+        self._required_as_none = {name: None for name, field in item_model.model_fields.items()
+                                  if field.is_required()}
+
+    def parse(self, content: bytes) -> pydantic.BaseModel:
+        if simdjson is not None:
+            document = simdjson.Parser().parse(content)
+            rows = [self._select(item) for item in document["data"]]
+            meta = document["meta"].as_dict()
+        else:
+            document = orjson.loads(content)
+            rows = [self._select(item) for item in document["data"]]
+            meta = document["meta"]
+
+        return self.list_model.model_construct(
+            data=[self.item_model.model_construct(set(row), **{**self._required_as_none, **row})
+                  for row in rows],
+            meta=_PAGINATION_META_ADAPTER.validate_python(meta))
+
+    def _select(self, item) -> Dict[str, Any]:
+        row = {}
+        for field in self.fields:
+            if field in item:
+                value = item[field]
+                if simdjson is not None and isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                elif simdjson is not None and isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                row[field] = value
+        return row
+
 
 class ClerkAPIClient(object):
+    # How long a fetched JSON Web Key Set is served from memory, and how often a forced
+    # refresh (e.g. after seeing an unknown key id) may actually hit the API.
+    _jwks_ttl = 300
+    _jwks_min_refresh_interval = 10
+
     def __init__(self, base_url: str, secret_key: str, headers: Optional[Dict[str, str]] = None):
         self.base_url = base_url
         self.secret_key = secret_key
         self.headers = headers if headers else {}
         self.headers["Authorization"] = f"Bearer {self.secret_key}"
 
-    def _get_url(self, endpoint: str) -> str:
-        return f"{self.base_url}{endpoint}"
+        # Share one pooled client across all calls so that requests to the Clerk API are
+        # multiplexed over kept-alive HTTP/2 connections instead of re-negotiating TLS.
+        self._client = self._create_client()
 
-    def _handle_response(self, response: requests.Response, response_model: Any):
-        if response.status_code >= 400:
-            response.raise_for_status()
-        try:
-            data = response.json()
-            return response_model.parse_obj(data)
-        except ValueError:
-            raise ValueError(f"Failed to parse response '{response.text}' as {response_model.__name__}")
+        self._jwks_cache: Optional[_CachedJWKS] = None
+        self._jwks_refresh_lock = threading.Lock()
 
-    def get_public_interstitial(self, params: Optional[GetPublicInterstitialParams] = None) -> InterstitialResponse:
-        url = self._get_url("/public/interstitial")
-        response = requests.get(url, headers=self.headers, params=params.dict() if params else None)
-        return self._handle_response(response, InterstitialResponse)
+    def _create_client(self) -> httpx.Client:
+        return httpx.Client(
+            base_url=self.base_url, headers=self.headers, http2=True, limits=_POOL_LIMITS, timeout=_TIMEOUT)
 
-    def get_jwks(self) -> JWKSResponse:
-        url = self._get_url("/jwks")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, JWKSResponse)
+    def _send(self, method: str, endpoint: str, params: Any = None,
+              data: Any = None, headers: Optional[Dict[str, str]] = None):
+        content, headers = _encode_body(data, headers)
+        return self._client.request(method, endpoint, params=_dump(params), content=content, headers=headers)
 
-    def get_client_list(self, params: Optional[GetClientListParams] = None) -> ClientListResponse:
-        url = self._get_url("/clients")
-        response = requests.get(url, headers=self.headers, params=params.dict() if params else None)
-        return self._handle_response(response, ClientListResponse)
+    def _request(self, method: str, endpoint: str, response_model: Any,
+                 params: Any = None, data: Any = None):
+        response = self._send(method, endpoint, params=params, data=data)
+        return self._handle_response(response, response_model)
+
+    def _handle_response(self, response: httpx.Response, response_model: Any):
+        response.raise_for_status()
+        try:
+            if isinstance(response_model, pydantic.TypeAdapter):
+                return response_model.validate_json(response.content)
+            if isinstance(response_model, _FieldSelection):
+                return response_model.parse(response.content)
+            return response_model.model_validate_json(response.content)
+        except pydantic.ValidationError:
+            raise ValueError(f"Failed to parse response '{response.text}' as {getattr(response_model, '__name__', response_model)}")
+
+    def get_public_interstitial(self, params: Optional[GetPublicInterstitialParams] = None) -> InterstitialResponse:
+        return self._request("GET", "/public/interstitial", InterstitialResponse, params=params)
+
+    def get_jwks(self, force_refresh: bool = False) -> JWKSResponse:
+        """
+        Returns the JSON Web Key Set of the instance.
+
+        The key set is kept in memory for `_jwks_ttl` seconds and then revalidated with a
+        conditional request.  Pass `force_refresh=True` when a token is signed with a key
+        id that is not in the cached set; the refresh is still skipped if the set was
+        fetched less than `_jwks_min_refresh_interval` seconds ago, and concurrent
+        refreshes share a single request.
+        """
+        return self._cached_jwks(force_refresh).jwks
+
+    def get_jwks_raw(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Returns the keys of the JSON Web Key Set as plain JWK dicts, as sent by Clerk.
+
+        This shares `get_jwks`'s cache, but hands out the keys without going through the
+        response models, for passing straight to a JWT library.
+        """
+        return self._cached_jwks(force_refresh).keys
+
+    def _cached_jwks(self, force_refresh: bool) -> _CachedJWKS:
+        cached = self._jwks_cache
+        if cached is not None and self._jwks_is_fresh(cached, force_refresh):
+            return cached
+        with self._jwks_refresh_lock:
+            if self._jwks_cache is not cached:
+                # Another thread refreshed the key set while we were waiting for the lock.
+                return self._jwks_cache
+            response = self._send("GET", "/jwks", headers=self._jwks_revalidation_headers())
+            return self._store_jwks(response)
+
+    def _jwks_is_fresh(self, cached: _CachedJWKS, force_refresh: bool) -> bool:
+        max_age = self._jwks_min_refresh_interval if force_refresh else self._jwks_ttl
+        return time.monotonic() - cached.fetched_at < max_age
+
+    def _jwks_revalidation_headers(self) -> Optional[Dict[str, str]]:
+        cached = self._jwks_cache
+        if cached is None:
+            return None
+        headers = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _store_jwks(self, response: httpx.Response) -> _CachedJWKS:
+        cached = self._jwks_cache
+        if response.status_code == 304 and cached is not None:
+            # Not modified: keep the parsed key set and restart its TTL.
+            self._jwks_cache = cached._replace(
+                fetched_at=time.monotonic(),
+                etag=response.headers.get("ETag", cached.etag),
+                last_modified=response.headers.get("Last-Modified", cached.last_modified))
+        else:
+            jwks = self._handle_response(response, JWKSResponse)
+            self._jwks_cache = _CachedJWKS(time.monotonic(), jwks, orjson.loads(response.content)["keys"],
+                                           response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return self._jwks_cache
+
+    def get_client_list(self, params: Optional[GetClientListParams] = None,
+                        fields: Optional[List[str]] = None) -> ClientListResponse:
+        """
+        Lists clients.  Pass `fields` to only decode those fields of each client; the
+        returned clients are not validated, and fields that weren't selected hold the
+        model's default, or None if they have none (check `model_fields_set` for the
+        ones that were decoded).
+        """
+        if fields is not None:
+            return self._request("GET", "/clients", _FieldSelection(ClientListResponse, Client, fields), params=params)
+        return self._request("GET", "/clients", ClientListResponse, params=params)
 
     def verify_client(self, data: VerifyClientRequest) -> ClientResponse:
-        url = self._get_url("/clients/verify")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, ClientResponse)
+        return self._request("POST", "/clients/verify", ClientResponse, data=data)
 
     def get_client(self, client_id: str) -> ClientResponse:
-        url = self._get_url(f"/clients/{client_id}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, ClientResponse)
+        return self._request("GET", f"/clients/{client_id}", ClientResponse)
 
     def create_email_address(self, data: CreateEmailAddressRequest) -> EmailAddressResponse:
-        url = self._get_url("/email_addresses")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, EmailAddressResponse)
+        return self._request("POST", "/email_addresses", EmailAddressResponse, data=data)
 
     def get_email_address(self, email_address_id: str) -> EmailAddressResponse:
-        url = self._get_url(f"/email_addresses/{email_address_id}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, EmailAddressResponse)
+        return self._request("GET", f"/email_addresses/{email_address_id}", EmailAddressResponse)
 
     def delete_email_address(self, email_address_id: str) -> DeletedObjectResponse:
-        url = self._get_url(f"/email_addresses/{email_address_id}")
-        response = requests.delete(url, headers=self.headers)
-        return self._handle_response(response, DeletedObjectResponse)
+        return self._request("DELETE", f"/email_addresses/{email_address_id}", DeletedObjectResponse)
 
     def update_email_address(self, email_address_id: str, data: UpdateEmailAddressRequest) -> EmailAddressResponse:
-        url = self._get_url(f"/email_addresses/{email_address_id}")
-        response = requests.patch(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, EmailAddressResponse)
+        return self._request("PATCH", f"/email_addresses/{email_address_id}", EmailAddressResponse, data=data)
 
     def create_phone_number(self, data: CreatePhoneNumberRequest) -> PhoneNumberResponse:
-        url = self._get_url("/phone_numbers")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, PhoneNumberResponse)
+        return self._request("POST", "/phone_numbers", PhoneNumberResponse, data=data)
 
     def get_phone_number(self, phone_number_id: str) -> PhoneNumberResponse:
-        url = self._get_url(f"/phone_numbers/{phone_number_id}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, PhoneNumberResponse)
+        return self._request("GET", f"/phone_numbers/{phone_number_id}", PhoneNumberResponse)
 
     def delete_phone_number(self, phone_number_id: str) -> DeletedObjectResponse:
-        url = self._get_url(f"/phone_numbers/{phone_number_id}")
-        response = requests.delete(url, headers=self.headers)
-        return self._handle_response(response, DeletedObjectResponse)
+        return self._request("DELETE", f"/phone_numbers/{phone_number_id}", DeletedObjectResponse)
 
     def update_phone_number(self, phone_number_id: str, data: UpdatePhoneNumberRequest) -> PhoneNumberResponse:
-        url = self._get_url(f"/phone_numbers/{phone_number_id}")
-        response = requests.patch(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, PhoneNumberResponse)
+        return self._request("PATCH", f"/phone_numbers/{phone_number_id}", PhoneNumberResponse, data=data)
 
     def get_session_list(self, params: Optional[GetSessionListParams] = None) -> SessionListResponse:
-        url = self._get_url("/sessions")
-        response = requests.get(url, headers=self.headers, params=params.dict() if params else None)
-        return self._handle_response(response, SessionListResponse)
+        return self._request("GET", "/sessions", SessionListResponse, params=params)
 
     def get_session(self, session_id: str) -> SessionResponse:
-        url = self._get_url(f"/sessions/{session_id}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, SessionResponse)
+        return self._request("GET", f"/sessions/{session_id}", SessionResponse)
 
     def revoke_session(self, session_id: str) -> SessionResponse:
-        url = self._get_url(f"/sessions/{session_id}/revoke")
-        response = requests.post(url, headers=self.headers)
-        return self._handle_response(response, SessionResponse)
+        return self._request("POST", f"/sessions/{session_id}/revoke", SessionResponse)
 
     def verify_session(self, session_id: str, data: VerifySessionRequest) -> SessionResponse:
-        url = self._get_url(f"/sessions/{session_id}/verify")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, SessionResponse)
+        return self._request("POST", f"/sessions/{session_id}/verify", SessionResponse, data=data)
 
     def create_session_token_from_template(self, session_id: str, template_name: str) -> Dict[str, str]:
-        url = self._get_url(f"/sessions/{session_id}/tokens/{template_name}")
-        response = requests.post(url, headers=self.headers)
-        return self._handle_response(response, Dict[str, str])
+        return self._request("POST", f"/sessions/{session_id}/tokens/{template_name}", _DICT_STR_STR_ADAPTER)
 
     def get_template_list(self, template_type: str) -> TemplateListResponse:
-        url = self._get_url(f"/templates/{template_type}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, TemplateListResponse)
+        return self._request("GET", f"/templates/{template_type}", TemplateListResponse)
 
     def get_template(self, template_type: str, slug: str) -> TemplateResponse:
-        url = self._get_url(f"/templates/{template_type}/{slug}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, TemplateResponse)
+        return self._request("GET", f"/templates/{template_type}/{slug}", TemplateResponse)
 
     def upsert_template(self, template_type: str, slug: str, data: UpsertTemplateRequest) -> TemplateResponse:
-        url = self._get_url(f"/templates/{template_type}/{slug}")
-        response = requests.put(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, TemplateResponse)
+        return self._request("PUT", f"/templates/{template_type}/{slug}", TemplateResponse, data=data)
 
     def revert_template(self, template_type: str, slug: str) -> TemplateResponse:
-        url = self._get_url(f"/templates/{template_type}/{slug}/revert")
-        response = requests.post(url, headers=self.headers)
-        return self._handle_response(response, TemplateResponse)
+        return self._request("POST", f"/templates/{template_type}/{slug}/revert", TemplateResponse)
 
     def preview_template(self, template_type: str, slug: str, data: PreviewTemplateRequest) -> Dict[str, Any]:
-        url = self._get_url(f"/templates/{template_type}/{slug}/preview")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, Dict[str, Any])
+        return self._request("POST", f"/templates/{template_type}/{slug}/preview", _DICT_STR_ANY_ADAPTER, data=data)
 
     def toggle_template_delivery(self, template_type: str, slug: str,
                                  data: ToggleTemplateDeliveryRequest) -> TemplateResponse:
-        url = self._get_url(f"/templates/{template_type}/{slug}/toggle_delivery")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, TemplateResponse)
-
-    def get_user_list(self, params: Optional[GetUserListParams] = None) -> UserListResponse:
-        url = self._get_url("/users")
-        response = requests.get(url, headers=self.headers, params=params.dict() if params else None)
-        return self._handle_response(response, UserListResponse)
+        return self._request("POST", f"/templates/{template_type}/{slug}/toggle_delivery", TemplateResponse, data=data)
+
+    def get_user_list(self, params: Optional[GetUserListParams] = None,
+                      fields: Optional[List[str]] = None) -> UserListResponse:
+        """
+        Lists users.  Pass `fields` (e.g. `["id", "first_name", "image_url"]`) to only
+        decode those fields of each user, which avoids materializing email addresses,
+        phone numbers and metadata for large pages.  The returned users are not
+        validated, and fields that weren't selected hold the model's default, or None
+        if they have none (e.g. `image_url`, `email_addresses`); `model_fields_set`
+        names the fields that were decoded.
+        """
+        if fields is not None:
+            return self._request("GET", "/users", _FieldSelection(UserListResponse, User, fields), params=params)
+        return self._request("GET", "/users", UserListResponse, params=params)
+
+    def iter_users(self, **filters: Any) -> Iterator[User]:
+        """
+        Iterates over every user matching `filters` (any `GetUserListParams` field other
+        than `limit` and `offset`), fetching them 500 at a time so that only one page of
+        users is held in memory.
+        """
+        offset = 0
+        while True:
+            users = self.get_user_list(GetUserListParams(limit=_MAX_PAGE_SIZE, offset=offset, **filters)).data
+            yield from users
+            if len(users) < _MAX_PAGE_SIZE:
+                return
+            offset += _MAX_PAGE_SIZE
 
     def create_user(self, data: CreateUserRequest) -> User:
-        url = self._get_url("/users")
-        response = requests.post(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, User)
+        return self._request("POST", "/users", User, data=data)
 
     def get_users_count(self, params: Optional[GetUsersCountParams] = None) -> UserCountResponse:
-        url = self._get_url("/users/count")
-        response = requests.get(url, headers=self.headers, params=params.dict() if params else None)
-        return self._handle_response(response, UserCountResponse)
+        return self._request("GET", "/users/count", UserCountResponse, params=params)
 
     def get_user(self, user_id: str) -> User:
-        url = self._get_url(f"/users/{user_id}")
-        response = requests.get(url, headers=self.headers)
-        return self._handle_response(response, User)
+        return self._request("GET", f"/users/{user_id}", User)
+
+    def get_users_by_ids(self, user_ids: List[str]) -> Dict[str, User]:
+        """
+        Fetches several users at once, keyed by id, using one request per 100 ids rather
+        than one `get_user` call per user.  Ids that match no user are left out.
+        """
+        users = {}
+        for params in _user_id_batches(user_ids):
+            users.update((user.id, user) for user in self.get_user_list(params).data)
+        return users
 
     def update_user(self, user_id: str, data: UpdateUserRequest) -> User:
-        url = self._get_url(f"/users/{user_id}")
-        response = requests.patch(url, headers=self.headers, json=data.dict())
-        return self._handle_response(response, User)
+        return self._request("PATCH", f"/users/{user_id}", User, data=data)
+
+
+class AsyncClerkAPIClient(ClerkAPIClient):
+    """
+    An asyncio variant of ClerkAPIClient.
+
+    Every endpoint method has the same parameters as on ClerkAPIClient, but is a
+    coroutine function and must be awaited, so that independent calls can be issued
+    concurrently (e.g. with `asyncio.gather`).  All calls share a single
+    `httpx.AsyncClient`; call `aclose()` once the client is no longer needed.
+    """
+
+    def __init__(self, base_url: str, secret_key: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(base_url, secret_key, headers)
+        # Created on first use, so that it is bound to the running event loop.
+        self._jwks_refresh_lock: Optional[asyncio.Lock] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url, headers=self.headers, http2=True, limits=_POOL_LIMITS, timeout=_TIMEOUT)
+
+    async def _send(self, method: str, endpoint: str, params: Any = None,
+                    data: Any = None, headers: Optional[Dict[str, str]] = None):
+        content, headers = _encode_body(data, headers)
+        return await self._client.request(method, endpoint, params=_dump(params), content=content, headers=headers)
+
+    async def _request(self, method: str, endpoint: str, response_model: Any,
+                       params: Any = None, data: Any = None):
+        response = await self._send(method, endpoint, params=params, data=data)
+        return self._handle_response(response, response_model)
+
+    async def get_jwks(self, force_refresh: bool = False) -> JWKSResponse:
+        return (await self._cached_jwks(force_refresh)).jwks
+
+    async def get_jwks_raw(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        return (await self._cached_jwks(force_refresh)).keys
+
+    async def _cached_jwks(self, force_refresh: bool) -> _CachedJWKS:
+        cached = self._jwks_cache
+        if cached is not None and self._jwks_is_fresh(cached, force_refresh):
+            return cached
+        if self._jwks_refresh_lock is None:
+            self._jwks_refresh_lock = asyncio.Lock()
+        async with self._jwks_refresh_lock:
+            if self._jwks_cache is not cached:
+                return self._jwks_cache
+            response = await self._send("GET", "/jwks", headers=self._jwks_revalidation_headers())
+            return self._store_jwks(response)
+
+    async def get_public_interstitial(self, params: Optional[GetPublicInterstitialParams] = None) -> InterstitialResponse:
+        return await self._request("GET", "/public/interstitial", InterstitialResponse, params=params)
+
+    async def get_client_list(self, params: Optional[GetClientListParams] = None,
+                              fields: Optional[List[str]] = None) -> ClientListResponse:
+        """
+        Lists clients.  Pass `fields` to only decode those fields of each client; the
+        returned clients are not validated, and fields that weren't selected hold the
+        model's default, or None if they have none (check `model_fields_set` for the
+        ones that were decoded).
+        """
+        if fields is not None:
+            return await self._request("GET", "/clients", _FieldSelection(ClientListResponse, Client, fields), params=params)
+        return await self._request("GET", "/clients", ClientListResponse, params=params)
+
+    async def verify_client(self, data: VerifyClientRequest) -> ClientResponse:
+        return await self._request("POST", "/clients/verify", ClientResponse, data=data)
+
+    async def get_client(self, client_id: str) -> ClientResponse:
+        return await self._request("GET", f"/clients/{client_id}", ClientResponse)
+
+    async def create_email_address(self, data: CreateEmailAddressRequest) -> EmailAddressResponse:
+        return await self._request("POST", "/email_addresses", EmailAddressResponse, data=data)
+
+    async def get_email_address(self, email_address_id: str) -> EmailAddressResponse:
+        return await self._request("GET", f"/email_addresses/{email_address_id}", EmailAddressResponse)
+
+    async def delete_email_address(self, email_address_id: str) -> DeletedObjectResponse:
+        return await self._request("DELETE", f"/email_addresses/{email_address_id}", DeletedObjectResponse)
+
+    async def update_email_address(self, email_address_id: str, data: UpdateEmailAddressRequest) -> EmailAddressResponse:
+        return await self._request("PATCH", f"/email_addresses/{email_address_id}", EmailAddressResponse, data=data)
+
+    async def create_phone_number(self, data: CreatePhoneNumberRequest) -> PhoneNumberResponse:
+        return await self._request("POST", "/phone_numbers", PhoneNumberResponse, data=data)
+
+    async def get_phone_number(self, phone_number_id: str) -> PhoneNumberResponse:
+        return await self._request("GET", f"/phone_numbers/{phone_number_id}", PhoneNumberResponse)
+
+    async def delete_phone_number(self, phone_number_id: str) -> DeletedObjectResponse:
+        return await self._request("DELETE", f"/phone_numbers/{phone_number_id}", DeletedObjectResponse)
+
+    async def update_phone_number(self, phone_number_id: str, data: UpdatePhoneNumberRequest) -> PhoneNumberResponse:
+        return await self._request("PATCH", f"/phone_numbers/{phone_number_id}", PhoneNumberResponse, data=data)
+
+    async def get_session_list(self, params: Optional[GetSessionListParams] = None) -> SessionListResponse:
+        return await self._request("GET", "/sessions", SessionListResponse, params=params)
+
+    async def get_session(self, session_id: str) -> SessionResponse:
+        return await self._request("GET", f"/sessions/{session_id}", SessionResponse)
+
+    async def revoke_session(self, session_id: str) -> SessionResponse:
+        return await self._request("POST", f"/sessions/{session_id}/revoke", SessionResponse)
+
+    async def verify_session(self, session_id: str, data: VerifySessionRequest) -> SessionResponse:
+        return await self._request("POST", f"/sessions/{session_id}/verify", SessionResponse, data=data)
+
+    async def create_session_token_from_template(self, session_id: str, template_name: str) -> Dict[str, str]:
+        return await self._request("POST", f"/sessions/{session_id}/tokens/{template_name}", _DICT_STR_STR_ADAPTER)
+
+    async def get_template_list(self, template_type: str) -> TemplateListResponse:
+        return await self._request("GET", f"/templates/{template_type}", TemplateListResponse)
+
+    async def get_template(self, template_type: str, slug: str) -> TemplateResponse:
+        return await self._request("GET", f"/templates/{template_type}/{slug}", TemplateResponse)
+
+    async def upsert_template(self, template_type: str, slug: str, data: UpsertTemplateRequest) -> TemplateResponse:
+        return await self._request("PUT", f"/templates/{template_type}/{slug}", TemplateResponse, data=data)
+
+    async def revert_template(self, template_type: str, slug: str) -> TemplateResponse:
+        return await self._request("POST", f"/templates/{template_type}/{slug}/revert", TemplateResponse)
+
+    async def preview_template(self, template_type: str, slug: str, data: PreviewTemplateRequest) -> Dict[str, Any]:
+        return await self._request("POST", f"/templates/{template_type}/{slug}/preview", _DICT_STR_ANY_ADAPTER, data=data)
+
+    async def toggle_template_delivery(self, template_type: str, slug: str,
+                                       data: ToggleTemplateDeliveryRequest) -> TemplateResponse:
+        return await self._request("POST", f"/templates/{template_type}/{slug}/toggle_delivery", TemplateResponse, data=data)
+
+    async def get_user_list(self, params: Optional[GetUserListParams] = None,
+                            fields: Optional[List[str]] = None) -> UserListResponse:
+        """
+        Lists users.  Pass `fields` (e.g. `["id", "first_name", "image_url"]`) to only
+        decode those fields of each user, which avoids materializing email addresses,
+        phone numbers and metadata for large pages.  The returned users are not
+        validated, and fields that weren't selected hold the model's default, or None
+        if they have none (e.g. `image_url`, `email_addresses`); `model_fields_set`
+        names the fields that were decoded.
+        """
+        if fields is not None:
+            return await self._request("GET", "/users", _FieldSelection(UserListResponse, User, fields), params=params)
+        return await self._request("GET", "/users", UserListResponse, params=params)
+
+    async def create_user(self, data: CreateUserRequest) -> User:
+        return await self._request("POST", "/users", User, data=data)
+
+    async def get_users_count(self, params: Optional[GetUsersCountParams] = None) -> UserCountResponse:
+        return await self._request("GET", "/users/count", UserCountResponse, params=params)
+
+    async def get_user(self, user_id: str) -> User:
+        return await self._request("GET", f"/users/{user_id}", User)
+
+    async def update_user(self, user_id: str, data: UpdateUserRequest) -> User:
+        return await self._request("PATCH", f"/users/{user_id}", User, data=data)
+
+    async def get_users_by_ids(self, user_ids: List[str]) -> Dict[str, User]:
+        pages = await asyncio.gather(*(self.get_user_list(params) for params in _user_id_batches(user_ids)))
+        return {user.id: user for page in pages for user in page.data}
+
+    async def iter_users(self, **filters: Any) -> AsyncIterator[User]:
+        offset = 0
+        while True:
+            users = (await self.get_user_list(GetUserListParams(limit=_MAX_PAGE_SIZE, offset=offset, **filters))).data
+            for user in users:
+                yield user
+            if len(users) < _MAX_PAGE_SIZE:
+                return
+            offset += _MAX_PAGE_SIZE
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP connection pool."""
+        await self._client.aclose()
 
 
 BASE_URL = "https://api.clerk.com/v1"
 
 
+@functools.lru_cache(maxsize=None)
 def get_client(secret_key) -> ClerkAPIClient:
     """
     Returns an instance of the ClerkAPIClient using the provided secret key.
+    Clients are memoized per secret key, so that callers share one connection pool.
 
     :param secret_key: The secret key used to authenticate the client.
     :type secret_key: str
@@ -183,3 +547,15 @@ def get_client(secret_key) -> ClerkAPIClient:
     :rtype: ClerkAPIClient
     """
     return ClerkAPIClient(BASE_URL, secret_key)
+
+
+def get_async_client(secret_key) -> AsyncClerkAPIClient:
+    """
+    Returns an instance of the AsyncClerkAPIClient using the provided secret key.
+
+    :param secret_key: The secret key used to authenticate the client.
+    :type secret_key: str
+    :return: An instance of the AsyncClerkAPIClient.
+    :rtype: AsyncClerkAPIClient
+    """
+    return AsyncClerkAPIClient(BASE_URL, secret_key)
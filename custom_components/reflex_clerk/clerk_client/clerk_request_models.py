@@ -1,28 +1,39 @@
+import sys
 from typing import Optional, List
 
-try:
-    from reflex.base import pydantic
-except ImportError:
-    import pydantic
+import pydantic
+from pydantic.dataclasses import dataclass
 
+# Request bodies and query parameters are built once per call and immediately dumped,
+# so they are plain (slotted, where supported) dataclasses rather than BaseModels.
+# Their validators are only built on first use, as most apps call a handful of endpoints.
+_request_model = dataclass(
+    config=pydantic.ConfigDict(extra="forbid", defer_build=True),
+    **({"slots": True} if sys.version_info >= (3, 10) else {}),
+)
 
-class VerifyClientRequest(pydantic.BaseModel):
+
+@_request_model
+class VerifyClientRequest:
     token: str
 
 
-class CreateEmailAddressRequest(pydantic.BaseModel):
+@_request_model
+class CreateEmailAddressRequest:
     user_id: str
     email_address: str
     verified: Optional[bool] = None
     primary: Optional[bool] = None
 
 
-class UpdateEmailAddressRequest(pydantic.BaseModel):
+@_request_model
+class UpdateEmailAddressRequest:
     verified: Optional[bool] = None
     primary: Optional[bool] = None
 
 
-class CreatePhoneNumberRequest(pydantic.BaseModel):
+@_request_model
+class CreatePhoneNumberRequest:
     user_id: str
     phone_number: str
     verified: Optional[bool] = None
@@ -30,13 +41,15 @@ class CreatePhoneNumberRequest(pydantic.BaseModel):
     reserved_for_second_factor: Optional[bool] = None
 
 
-class UpdatePhoneNumberRequest(pydantic.BaseModel):
+@_request_model
+class UpdatePhoneNumberRequest:
     verified: Optional[bool] = None
     primary: Optional[bool] = None
     reserved_for_second_factor: Optional[bool] = None
 
 
-class CreateUserRequest(pydantic.BaseModel):
+@_request_model
+class CreateUserRequest:
     external_id: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -57,7 +70,8 @@ class CreateUserRequest(pydantic.BaseModel):
     created_at: Optional[str] = None
 
 
-class UpdateUserRequest(pydantic.BaseModel):
+@_request_model
+class UpdateUserRequest:
     external_id: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -72,46 +86,54 @@ class UpdateUserRequest(pydantic.BaseModel):
     password_hasher: Optional[str] = None
 
 
-class UpsertTemplateRequest(pydantic.BaseModel):
+@_request_model
+class UpsertTemplateRequest:
     name: str
+    body: str
     subject: Optional[str] = None
     markup: Optional[str] = None
-    body: str
     delivered_by_clerk: Optional[bool] = None
     from_email_name: Optional[str] = None
     reply_to_email_name: Optional[str] = None
 
 
-class PreviewTemplateRequest(pydantic.BaseModel):
-    subject: Optional[str] = None
+@_request_model
+class PreviewTemplateRequest:
     body: str
+    subject: Optional[str] = None
     from_email_name: Optional[str] = None
     reply_to_email_name: Optional[str] = None
 
 
-class ToggleTemplateDeliveryRequest(pydantic.BaseModel):
+@_request_model
+class ToggleTemplateDeliveryRequest:
     delivered_by_clerk: Optional[bool] = None
 
 
-class VerifySessionRequest(pydantic.BaseModel):
+@_request_model
+class VerifySessionRequest:
     token: str
 
 
-class CreateSessionTokenFromTemplateRequest(pydantic.BaseModel):
+@_request_model
+class CreateSessionTokenFromTemplateRequest:
     pass
 
 
-class GetPublicInterstitialParams(pydantic.BaseModel):
+@_request_model
+class GetPublicInterstitialParams:
     frontendApi: Optional[str] = None
     publishable_key: Optional[str] = None
 
 
-class GetClientListParams(pydantic.BaseModel):
+@_request_model
+class GetClientListParams:
     limit: Optional[int] = None
     offset: Optional[int] = None
 
 
-class GetSessionListParams(pydantic.BaseModel):
+@_request_model
+class GetSessionListParams:
     client_id: Optional[str] = None
     user_id: Optional[str] = None
     status: Optional[str] = None
@@ -119,7 +141,8 @@ class GetSessionListParams(pydantic.BaseModel):
     offset: Optional[int] = None
 
 
-class GetUserListParams(pydantic.BaseModel):
+@_request_model
+class GetUserListParams:
     email_address: Optional[List[str]] = None
     phone_number: Optional[List[str]] = None
     external_id: Optional[List[str]] = None
@@ -134,7 +157,8 @@ class GetUserListParams(pydantic.BaseModel):
     order_by: Optional[str] = None
 
 
-class GetUsersCountParams(pydantic.BaseModel):
+@_request_model
+class GetUsersCountParams:
     email_address: Optional[List[str]] = None
     phone_number: Optional[List[str]] = None
     external_id: Optional[List[str]] = None
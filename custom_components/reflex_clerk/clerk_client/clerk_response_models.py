@@ -1,12 +1,49 @@
-from typing import Optional, List, Dict, Any, Literal
+import sys
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Literal, Type, TypeVar
 
-try:
-    from reflex.base import pydantic
-except ImportError:
-    import pydantic
+import pydantic
+from pydantic.dataclasses import dataclass
 
 
-class ClerkError(pydantic.BaseModel):
+_ResponseT = TypeVar("_ResponseT", bound="ClerkResponse")
+
+# Free-form metadata set by the application.  Clerk always sends a JSON object here, and
+# walking it again to check `Dict[str, Any]` only copies it, so it is taken as parsed.
+_Metadata = pydantic.SkipValidation[Dict[str, Any]]
+
+
+class _ClerkModel(pydantic.BaseModel):
+    # Validators are built on first use rather than at import, as most apps only ever
+    # see a few of the models below.
+    model_config = pydantic.ConfigDict(defer_build=True)
+
+
+# The smallest leaf objects are materialized in bulk (every link of every email address
+# of every user in a list), so they are immutable dataclasses, slotted where supported,
+# rather than BaseModels carrying an instance dict each.
+_leaf_model = dataclass(
+    frozen=True,
+    config=pydantic.ConfigDict(defer_build=True),
+    **({"slots": True} if sys.version_info >= (3, 10) else {}),
+)
+
+
+class ClerkResponse(_ClerkModel):
+    """
+    Base class for the top-level response bodies returned by the Clerk API.
+    """
+
+    @classmethod
+    def parse_raw_response(cls: Type[_ResponseT], data: bytes) -> _ResponseT:
+        """
+        Parses and validates a raw JSON response body in a single pass, without
+        decoding it into intermediate Python dicts first.
+        """
+        return cls.model_validate_json(data)
+
+
+class ClerkError(_ClerkModel):
     """
     Represents an error response from the Clerk API.
     """
@@ -14,7 +51,7 @@ class ClerkError(pydantic.BaseModel):
     code: Optional[int] = None
 
 
-class DeletedObjectResponse(pydantic.BaseModel):
+class DeletedObjectResponse(ClerkResponse):
     """
     Represents the response for a successfully deleted object.
     """
@@ -22,7 +59,8 @@ class DeletedObjectResponse(pydantic.BaseModel):
     object: str
 
 
-class PaginationMeta(pydantic.BaseModel):
+@_leaf_model
+class PaginationMeta:
     """
     Metadata for pagination.
     """
@@ -31,7 +69,7 @@ class PaginationMeta(pydantic.BaseModel):
     offset: int
 
 
-class Verification(pydantic.BaseModel):
+class Verification(_ClerkModel):
     """
     Represents the verification details of an email address or phone number.
 
@@ -55,7 +93,8 @@ class Verification(pydantic.BaseModel):
     external_verification_redirect_url: Optional[str] = None
 
 
-class IdentificationLink(pydantic.BaseModel):
+@_leaf_model
+class IdentificationLink:
     """
     Represents a link between an email address or phone number and another identification type.
 
@@ -67,7 +106,7 @@ class IdentificationLink(pydantic.BaseModel):
     id: str
 
 
-class EmailAddress(pydantic.BaseModel):
+class EmailAddress(_ClerkModel):
     """
     Represents an email address associated with a user.
 
@@ -89,14 +128,14 @@ class EmailAddress(pydantic.BaseModel):
     updated_at: int
 
 
-class EmailAddressResponse(pydantic.BaseModel):
+class EmailAddressResponse(ClerkResponse):
     """
     Represents the response containing an email address.
     """
     data: EmailAddress
 
 
-class PhoneNumber(pydantic.BaseModel):
+class PhoneNumber(_ClerkModel):
     """
     Represents a phone number associated with a user.
 
@@ -123,14 +162,14 @@ class PhoneNumber(pydantic.BaseModel):
     updated_at: int
 
 
-class PhoneNumberResponse(pydantic.BaseModel):
+class PhoneNumberResponse(ClerkResponse):
     """
     Represents the response containing a phone number.
     """
     data: PhoneNumber
 
 
-class Session(pydantic.BaseModel):
+class Session(_ClerkModel):
     """
     Represents a session object.
     """
@@ -144,7 +183,7 @@ class Session(pydantic.BaseModel):
     last_active_at: Optional[int] = None
 
 
-class SessionListResponse(pydantic.BaseModel):
+class SessionListResponse(ClerkResponse):
     """
     Represents the response containing a list of sessions.
     """
@@ -152,14 +191,14 @@ class SessionListResponse(pydantic.BaseModel):
     meta: PaginationMeta
 
 
-class SessionResponse(pydantic.BaseModel):
+class SessionResponse(ClerkResponse):
     """
     Represents the response containing a session.
     """
     data: Session
 
 
-class Client(pydantic.BaseModel):
+class Client(_ClerkModel):
     """
     Represents a client object.
     """
@@ -174,7 +213,7 @@ class Client(pydantic.BaseModel):
     status: Optional[str] = None
 
 
-class ClientListResponse(pydantic.BaseModel):
+class ClientListResponse(ClerkResponse):
     """
     Represents the response containing a list of clients.
     """
@@ -182,14 +221,14 @@ class ClientListResponse(pydantic.BaseModel):
     meta: PaginationMeta
 
 
-class ClientResponse(pydantic.BaseModel):
+class ClientResponse(ClerkResponse):
     """
     Represents the response containing a client.
     """
     data: Client
 
 
-class Template(pydantic.BaseModel):
+class Template(_ClerkModel):
     """
     Represents a template object for email or SMS.
     """
@@ -204,7 +243,7 @@ class Template(pydantic.BaseModel):
     reply_to_email_name: Optional[str] = None
 
 
-class TemplateListResponse(pydantic.BaseModel):
+class TemplateListResponse(ClerkResponse):
     """
     Represents the response containing a list of templates.
     """
@@ -212,14 +251,14 @@ class TemplateListResponse(pydantic.BaseModel):
     meta: PaginationMeta
 
 
-class TemplateResponse(pydantic.BaseModel):
+class TemplateResponse(ClerkResponse):
     """
     Represents the response containing a template.
     """
     data: Template
 
 
-class Web3Wallet(pydantic.BaseModel):
+class Web3Wallet(_ClerkModel):
     """
     Represents a Web3 wallet address associated with a user.
 
@@ -246,7 +285,7 @@ class Web3Wallet(pydantic.BaseModel):
     verification: Optional[Verification] = None
 
 
-class SAMLAccount(pydantic.BaseModel):
+class SAMLAccount(_ClerkModel):
     """
     Represents a SAML account associated with a user.
 
@@ -270,11 +309,11 @@ class SAMLAccount(pydantic.BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     provider_user_id: Optional[str] = None
-    public_metadata: Dict[str, Any]
+    public_metadata: _Metadata
     verification: Optional[Verification] = None
 
 
-class PasskeyResource(pydantic.BaseModel):
+class PasskeyResource(_ClerkModel):
     """
     Represents a passkey associated with a user response.
 
@@ -282,9 +321,9 @@ class PasskeyResource(pydantic.BaseModel):
         id: The passkey's unique ID generated by Clerk.
         verification: Verification details for the passkey.
         name: The passkey's name.
-        created_at: The date and time when the passkey was created.
-        updated_at: The date and time when the passkey was updated.
-        last_used_at: The date and time when the passkey was last used.
+        created_at: Unix timestamp (in milliseconds) of when the passkey was created.
+        updated_at: Unix timestamp (in milliseconds) of when the passkey was updated.
+        last_used_at: Unix timestamp (in milliseconds) of when the passkey was last used.
 
     """
 
@@ -297,17 +336,26 @@ class PasskeyResource(pydantic.BaseModel):
     name: str
     """The passkey's name."""
 
-    created_at: str
-    """The date and time when the passkey was created."""
+    created_at: int
+    """Unix timestamp (in milliseconds) of when the passkey was created."""
+
+    updated_at: int
+    """Unix timestamp (in milliseconds) of when the passkey was updated."""
 
-    updated_at: str
-    """The date and time when the passkey was updated."""
+    last_used_at: int
+    """Unix timestamp (in milliseconds) of when the passkey was last used."""
 
-    last_used_at: str
-    """The date and time when the passkey was last used."""
+    @pydantic.field_validator("created_at", "updated_at", "last_used_at", mode="before")
+    @classmethod
+    def _iso_to_timestamp(cls, value: Any) -> Any:
+        # Accept ISO 8601 dates as well, converted once here to the millisecond Unix
+        # timestamps used everywhere else in this module.
+        if isinstance(value, str) and not value.isdigit():
+            return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000)
+        return value
 
 
-class User(pydantic.BaseModel):
+class User(_ClerkModel):
     """
     Represents a user object with various attributes related to their profile, authentication, and metadata.
 
@@ -387,13 +435,13 @@ class User(pydantic.BaseModel):
      Returns false if Clerk is displaying an avatar for the user.
      """
 
-    public_metadata: Dict[str, Any]
+    public_metadata: _Metadata
     """Metadata that can be read from the Frontend API and Backend API and can be set only from the Backend API."""
 
-    private_metadata: Optional[Dict[str, Any]] = None
+    private_metadata: Optional[_Metadata] = None
     """Metadata that can be read and set only from the Backend API."""
 
-    unsafe_metadata: Dict[str, Any]
+    unsafe_metadata: _Metadata
     """
     Metadata that can be read and set from the Frontend API. Often used
     for custom fields attached to the User object.
@@ -436,7 +484,7 @@ class User(pydantic.BaseModel):
     """A boolean indicating whether the user is locked."""
 
 
-class UserListResponse(pydantic.BaseModel):
+class UserListResponse(ClerkResponse):
     """
     Represents the response containing a list of users.
     """
@@ -444,21 +492,22 @@ class UserListResponse(pydantic.BaseModel):
     meta: PaginationMeta
 
 
-class UserCountResponse(pydantic.BaseModel):
+class UserCountResponse(ClerkResponse):
     """
     Represents the response containing the count of users.
     """
     count: int
 
 
-class InterstitialResponse(pydantic.BaseModel):
+class InterstitialResponse(ClerkResponse):
     """
     Represents the response containing the interstitial HTML.
     """
     html: str
 
 
-class Key(pydantic.BaseModel):
+@_leaf_model
+class Key:
     """
     Represents a key in the JSON Web Key Set (JWKS).
     """
@@ -469,7 +518,7 @@ class Key(pydantic.BaseModel):
     e: str
 
 
-class JWKSResponse(pydantic.BaseModel):
+class JWKSResponse(ClerkResponse):
     """
     Represents the response containing the JSON Web Key Set (JWKS).
     """
@@ -1,25 +1,35 @@
 import typing
 
-try:
-    from reflex.base import pydantic
-except ImportError:
-    import pydantic
+import pydantic
 
 
 class AppearanceVariables(pydantic.BaseModel):
     """Variables for the appearance."""
 
-    colorPrimary: str = None
+    model_config = pydantic.ConfigDict(defer_build=True)
+
+    colorPrimary: typing.Optional[str] = None
     # todo: flush this out
 
 
-class Appearance(pydantic.BaseModel):
-    """Appearance configuration for the ClerkProvider component."""
+BaseTheme = typing.Literal["default", "dark", "shadesOfPurple", "neobrutalism"]
+
+
+class AppearanceLeaf(pydantic.BaseModel):
+    """Appearance configuration for a single Clerk component, e.g. `Appearance.signIn`."""
+
+    model_config = pydantic.ConfigDict(defer_build=True)
 
-    baseTheme: typing.Union[typing.Literal["default", "dark", "shadesOfPurple", "neobrutalism"], typing.List[
-        typing.Literal["default", "dark", "shadesOfPurple", "neobrutalism"]]] = None
+    baseTheme: typing.Optional[typing.Union[BaseTheme, typing.List[BaseTheme]]] = None
+    """One theme, or a list of themes to stack; either is passed to Clerk as given."""
+
+    variables: typing.Optional[AppearanceVariables] = None
+    elements: typing.Any = None
+    """Style overrides keyed by Clerk element name; passed through to Clerk unvalidated."""
+
+
+class Appearance(AppearanceLeaf):
+    """Appearance configuration for the ClerkProvider component."""
 
-    signIn: "Appearance" = None
-    signUp: "Appearance" = None
-    variables: AppearanceVariables = None
-    elements: typing.Dict[str, typing.Any] = None
+    signIn: typing.Optional[AppearanceLeaf] = None
+    signUp: typing.Optional[AppearanceLeaf] = None
@@ -0,0 +1,20 @@
+"""Definitions shared by the reflex_clerk components."""
+import reflex as rx
+
+# The React library every Clerk component is imported from.
+CLERK_LIBRARY = "@clerk/clerk-react"
+
+
+class ClerkComponent(rx.Component):
+    """Base class for the components wrapping @clerk/clerk-react."""
+
+    # The React library to wrap.
+    library = CLERK_LIBRARY
+
+
+def create_component(component_cls, *children, **props):
+    """
+    Creates a component, leaving out the props that weren't set; Reflex would otherwise
+    validate each None prop, only to drop it when rendering.
+    """
+    return component_cls.create(*children, **{k: v for k, v in props.items() if v is not None})
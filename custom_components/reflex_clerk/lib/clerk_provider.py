@@ -1,16 +1,34 @@
-import json
+import asyncio
+import base64
+import dataclasses
+import functools
+import hashlib
 import logging
 import os
+import sys
+import threading
+import time
 import typing
-from typing import List, Union
+import warnings
+from collections import OrderedDict
+from typing import Union
 
+import orjson
 import reflex as rx
-from authlib.jose import jwt, JoseError, JWTClaims
+from authlib.jose import JoseError, JsonWebKey, JsonWebToken, JWTClaims, Key
+from authlib.jose.errors import DecodeError
 from reflex import Component, ImportVar
 from reflex.utils.serializers import serializer
 
 from reflex_clerk.clerk_client import clerk_client, clerk_response_models
-from reflex_clerk.clerk_client.clerk_client import ClerkAPIClient
+from reflex_clerk.clerk_client.clerk_client import AsyncClerkAPIClient, ClerkAPIClient
+from reflex_clerk.lib.clerk_component import CLERK_LIBRARY, ClerkComponent
+
+logger = logging.getLogger(__name__)
+
+# Set once the missing-keys warning has been logged, as it would otherwise be repeated
+# for every sign in.
+_warned_missing_keys = False
 
 
 @serializer
@@ -20,7 +38,264 @@ def serialize_exception(e: Exception) -> dict:
 
 @serializer
 def serialize_clerk_user(user: clerk_response_models.User) -> dict:
-    return user.dict()
+    return user.model_dump(mode="json")
+
+
+class _ClaimsCache(object):
+    """
+    A thread-safe LRU of verified session token claims, keyed by the SHA-256 digest
+    of the token.  Entries are dropped once the token's `exp` has passed, so a cached
+    token is never accepted for longer than a freshly verified one would be.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, typing.Tuple[float, JWTClaims]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> typing.Optional[JWTClaims]:
+        key = hashlib.sha256(token.encode()).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, token: str, claims: JWTClaims) -> None:
+        expires_at = claims.get('exp')
+        if not isinstance(expires_at, (int, float)):
+            # Without an expiry there is no safe point to evict the entry at.
+            return
+        key = hashlib.sha256(token.encode()).digest()
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Shared by every ClerkState instance: the same session token is re-sent on every
+# reconnect, and verifying its RSA signature again each time is wasted work.
+_claims_cache = _ClaimsCache()
+
+# Claims every Clerk session token carries, checked as part of decoding the token; the
+# leeway (in seconds) allows for clock skew between Clerk and this server.
+_CLAIMS_OPTIONS = {"sub": {"essential": True}, "exp": {"essential": True}, "iat": {"essential": True}}
+_CLAIMS_LEEWAY = 30
+
+# Clerk signs session tokens with RS256 only.  Decoding with authlib's module-level `jwt`
+# would accept whatever algorithm the token's header names, e.g. an HS256 header naming
+# one of the RSA keys.
+_session_jwt = JsonWebToken(["RS256"])
+
+
+@dataclasses.dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
+class _JwksCache(object):
+    """
+    The JWT public keys in use, replaced as a whole whenever they are reloaded so that
+    the keys and their parsed form can never be out of step.
+    """
+
+    keys: typing.List[typing.Dict[str, str]]
+    """The keys as JWK dicts, as returned by ClerkState.jwt_public_keys."""
+
+    by_kid: typing.Dict[typing.Optional[str], Key]
+    """The same keys by key id; importing a JWK builds an RSA public key object."""
+
+    fetched_at: float = float("-inf")
+    """When the keys were last fetched from the Clerk API, by time.monotonic()."""
+
+    @classmethod
+    def parse(cls, keys: typing.List[typing.Dict[str, str]], fetched_at: float = float("-inf")) -> '_JwksCache':
+        by_kid = {key.kid: key for key in JsonWebKey.import_key_set({"keys": keys}).keys} if keys else {}
+        return cls(keys, by_kid, fetched_at)
+
+
+_jwks: _JwksCache = _JwksCache([], {})
+
+
+def _signing_key(token: str, jwks: _JwksCache) -> typing.Optional[Key]:
+    """
+    Returns the key a session token claims to be signed with, read from the `kid` of its
+    header, so that only that one key is tried.  Returns None if no key has that id.
+    """
+    try:
+        header_segment = token.split('.', 1)[0]
+        header = orjson.loads(base64.urlsafe_b64decode(header_segment + '=' * (-len(header_segment) % 4)))
+        kid = header.get('kid')
+    except (ValueError, AttributeError):
+        raise DecodeError("Invalid session token header")
+    if kid is not None and not isinstance(kid, str):
+        raise DecodeError("Invalid session token header")
+
+    by_kid = jwks.by_kid
+    if kid is None and len(by_kid) == 1:
+        return next(iter(by_kid.values()))
+    return by_kid.get(kid)
+
+
+def _cache_once_set(read_env):
+    """
+    Memoizes a function reading configuration from the environment, but only once it
+    returns a value: Reflex evaluates ClerkState's properties while defining the class,
+    i.e. on import, and an app may only load its environment (e.g. with python-dotenv)
+    after importing reflex_clerk.  Until the variable is set it is read again each time.
+    """
+    cached = []
+
+    @functools.wraps(read_env)
+    def wrapper():
+        if cached:
+            return cached[0]
+        value = read_env()
+        if value:
+            cached.append(value)
+        return value
+
+    wrapper.cache_clear = cached.clear
+    return wrapper
+
+
+@_cache_once_set
+def _secret_key_from_env() -> typing.Optional[str]:
+    return os.environ.get('CLERK_SECRET_KEY')
+
+
+@_cache_once_set
+def _jwt_public_keys_from_env() -> typing.List[typing.Dict[str, str]]:
+    """
+    Returns the keys set in CLERK_JWT_PUBLIC_KEYS, a JSON array of JWKs (or a single
+    JWK object).  Comma-separated JWK objects are still accepted, but deprecated.
+    """
+    value = os.environ.get('CLERK_JWT_PUBLIC_KEYS')
+    if not value:
+        return []
+    try:
+        keys = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        warnings.warn(
+            "CLERK_JWT_PUBLIC_KEYS should be a JSON array of keys; comma-separated "
+            "keys are deprecated.", DeprecationWarning, stacklevel=2)
+        return list(map(orjson.loads, value.split(',')))
+    return keys if isinstance(keys, list) else [keys]
+
+
+# When a token names a key id we don't have, Clerk has probably rotated its signing keys
+# and the JWKS is fetched again; but at most this often, so that tokens with made-up key
+# ids can't turn into a stream of requests to the Clerk API.
+_JWKS_MIN_REFRESH_INTERVAL = 300
+
+# Guards loading the JWKS: the threading lock for the synchronous ClerkState.jwt_public_keys
+# property, and an asyncio lock for the event handlers, so that a fetch from Clerk never
+# blocks the event loop (and every other session on the worker) while it waits.  The
+# asyncio lock is created on first use, so that it is bound to the running event loop.
+_jwks_refresh_lock = threading.Lock()
+_jwks_async_lock: typing.Optional[asyncio.Lock] = None
+
+
+def _jwks_lock() -> asyncio.Lock:
+    global _jwks_async_lock
+    if _jwks_async_lock is None:
+        _jwks_async_lock = asyncio.Lock()
+    return _jwks_async_lock
+
+
+async def _load_jwt_public_keys() -> typing.List[typing.Dict[str, str]]:
+    """The event handlers' counterpart of ClerkState.jwt_public_keys, fetching through the async client."""
+    global _jwks
+    if not _jwks.keys:
+        async with _jwks_lock():
+            if not _jwks.keys:
+                if ClerkState.secret_key:
+                    keys = await ClerkState.async_clerk_api_client.get_jwks_raw()
+                    _jwks = _JwksCache.parse(keys, time.monotonic())
+                else:
+                    _jwks = _JwksCache.parse(_jwt_public_keys_from_env())
+    return _jwks.keys
+
+
+async def _refresh_jwt_public_keys() -> None:
+    global _jwks
+    async with _jwks_lock():
+        # Concurrent misses queue up here; all but the first find the keys just refreshed.
+        now = time.monotonic()
+        if now - _jwks.fetched_at < _JWKS_MIN_REFRESH_INTERVAL:
+            return
+        # Marked as refreshed before fetching, so that a failing fetch isn't retried
+        # on every request either.
+        _jwks = dataclasses.replace(_jwks, fetched_at=now)
+        if ClerkState.secret_key:
+            keys = await ClerkState.async_clerk_api_client.get_jwks_raw(force_refresh=True)
+            _jwks = _JwksCache.parse(keys, now)
+
+
+# The API clients hold connection pools and locks, so they are kept here rather than on
+# ClerkState: Reflex turns underscored state attributes into backend vars, which are
+# deep-copied into (and pickled with) every state instance.
+_clerk_api_client: typing.Optional[ClerkAPIClient] = None
+_async_clerk_api_client: typing.Optional[AsyncClerkAPIClient] = None
+
+# Guards creating the API clients, so that a burst of first requests shares one client
+# (and one connection pool) rather than each creating its own.
+_init_lock = threading.Lock()
+
+# Users fetched from Clerk in the last _USER_CACHE_TTL seconds, as (fetched at, user), and
+# the fetches still in progress: a user opening several tabs signs in from each of them
+# at once, and they should all share a single request to the Clerk API.
+_USER_CACHE_TTL = 30
+_USER_CACHE_MAXSIZE = 1024
+_user_cache: typing.Dict[str, typing.Tuple[float, clerk_response_models.User]] = {}
+_user_fetches: typing.Dict[str, "asyncio.Future[clerk_response_models.User]"] = {}
+
+
+def _cached_user(user_id: str) -> typing.Optional[clerk_response_models.User]:
+    entry = _user_cache.get(user_id)
+    if entry is None or time.monotonic() - entry[0] >= _USER_CACHE_TTL:
+        return None
+    return entry[1]
+
+
+def _user_fetched(user_id: str, fetch: "asyncio.Future[clerk_response_models.User]") -> None:
+    del _user_fetches[user_id]
+    if fetch.cancelled() or fetch.exception() is not None:
+        return
+    now = time.monotonic()
+    if len(_user_cache) >= _USER_CACHE_MAXSIZE:
+        for stale_id in [k for k, (fetched_at, _) in _user_cache.items() if now - fetched_at >= _USER_CACHE_TTL]:
+            del _user_cache[stale_id]
+    if len(_user_cache) < _USER_CACHE_MAXSIZE:
+        _user_cache[user_id] = (now, fetch.result())
+
+
+async def _get_user(user_id: str) -> clerk_response_models.User:
+    """
+    Fetches a user from the Clerk API, joining the request already in flight for the
+    same user if there is one.
+    """
+    fetch = _user_fetches.get(user_id)
+    if fetch is None:
+        fetch = asyncio.ensure_future(ClerkState.async_clerk_api_client.get_user(user_id))
+        _user_fetches[user_id] = fetch
+        fetch.add_done_callback(functools.partial(_user_fetched, user_id))
+    # Shielded, so that one caller going away doesn't cancel the fetch for the others.
+    return await asyncio.shield(fetch)
+
+
+class _classproperty(property):
+    """
+    A read-only property evaluated against the class, for ClerkState settings that are
+    shared by all state instances.  Replaces stacking @classmethod on @property, which
+    is deprecated since Python 3.11 and no longer works on 3.13.  Subclasses property so
+    that Reflex (and pydantic) leave it alone rather than treating it as a state var.
+    """
+
+    def __get__(self, instance, owner=None):
+        return self.fget(owner if owner is not None else type(instance))
 
 
 class ClerkState(rx.State):
@@ -110,39 +385,56 @@ class ClerkState(rx.State):
     """
 
     # static class variables
-    _jwt_public_keys: List[typing.Dict[str, str]] = []
     _secret_key: str = None
-    _clerk_api_client: ClerkAPIClient = None
     _fetch_user: bool = True
 
-    # noinspection PyPropertyDefinition
-    @classmethod
-    @property
+    @_classproperty
     def secret_key(cls) -> str:
         if cls._secret_key is None:
-            if 'CLERK_SECRET_KEY' in os.environ:
-                cls._secret_key = os.environ['CLERK_SECRET_KEY']
+            # Not stored until it is set, so that a key loaded into the environment
+            # after ClerkState was defined is still picked up.
+            secret_key = _secret_key_from_env()
+            if secret_key is None:
+                return None
+            cls._secret_key = secret_key
 
         return cls._secret_key
 
-    # noinspection PyPropertyDefinition
-    @classmethod
-    @property
+    @_classproperty
     def jwt_public_keys(cls) -> typing.List[typing.Dict[str, str]]:
-        if not cls._jwt_public_keys:
-            if 'CLERK_JWT_PUBLIC_KEYS' in os.environ:
-                cls._jwt_public_keys = list(map(json.loads, os.environ['CLERK_JWT_PUBLIC_KEYS'].split(',')))
-            if cls.secret_key and cls.clerk_api_client:
-                cls._jwt_public_keys = cls._clerk_api_client.get_jwks().dict()['keys']
-        return cls._jwt_public_keys
-
-    # noinspection PyPropertyDefinition
-    @classmethod
-    @property
+        global _jwks
+        if not _jwks.keys:
+            with _jwks_refresh_lock:
+                if not _jwks.keys:
+                    if cls.secret_key and cls.clerk_api_client:
+                        _jwks = _JwksCache.parse(cls.clerk_api_client.get_jwks_raw(), time.monotonic())
+                    else:
+                        _jwks = _JwksCache.parse(_jwt_public_keys_from_env())
+        return _jwks.keys
+
+    @_classproperty
     def clerk_api_client(cls) -> clerk_client.ClerkAPIClient:
-        if cls._clerk_api_client is None:
-            cls._clerk_api_client = clerk_client.get_client(cls.secret_key)
-        return cls._clerk_api_client
+        global _clerk_api_client
+        # Also recreated if the secret key has changed: Reflex reads this property while
+        # defining ClerkState, before ClerkProvider has had a chance to set the key.
+        client = _clerk_api_client
+        if client is None or client.secret_key != cls.secret_key:
+            with _init_lock:
+                if _clerk_api_client is None or _clerk_api_client.secret_key != cls.secret_key:
+                    _clerk_api_client = clerk_client.get_client(cls.secret_key)
+                client = _clerk_api_client
+        return client
+
+    @_classproperty
+    def async_clerk_api_client(cls) -> clerk_client.AsyncClerkAPIClient:
+        global _async_clerk_api_client
+        client = _async_clerk_api_client
+        if client is None or client.secret_key != cls.secret_key:
+            with _init_lock:
+                if _async_clerk_api_client is None or _async_clerk_api_client.secret_key != cls.secret_key:
+                    _async_clerk_api_client = clerk_client.get_async_client(cls.secret_key)
+                client = _async_clerk_api_client
+        return client
 
     @classmethod
     def set_fetch_user_on_auth(cls, fetch_user: bool):
@@ -167,32 +459,57 @@ class ClerkState(rx.State):
         """
         cls._fetch_user = fetch_user
 
-    def set_clerk_session(self, token: str) -> None:
+    async def set_clerk_session(self, token: str):
         """
         Validates a Clerk session token and optionally fetches the associated
         user object.  This is used internally by reflex_clerk to manage the
         current auth state of users: it is called by the frontend whenever
         the Clerk isSignedIn auth state changes from false to true.
 
+        The user is fetched by a follow-up ClerkState.fetch_user event, so the
+        signed-in state reaches the frontend without waiting on the Clerk API.
+
         Args:
             token: A JWT token used to authenticate and authorize the user.
         """
-        if not ClerkState._jwt_public_keys:
-            print(f"No Clerk JWT public keys found. Skipping Clerk session set.")
+        global _warned_missing_keys
+        if not isinstance(token, str):
+            self.auth_error = DecodeError("Session token must be a string")
+            logger.warning("Auth error: %s", self.auth_error)
+            return
+
+        if not await _load_jwt_public_keys():
+            if not _warned_missing_keys:
+                _warned_missing_keys = True
+                logger.warning("No Clerk JWT public keys found. Skipping Clerk session set.")
             return
 
         try:
-            decoded: JWTClaims = jwt.decode(token, {"keys": ClerkState.jwt_public_keys})
+            decoded = _claims_cache.get(token)
+            if decoded is None:
+                key = _signing_key(token, _jwks)
+                if key is None:
+                    await _refresh_jwt_public_keys()
+                    key = _signing_key(token, _jwks)
+                if key is None:
+                    raise DecodeError("Session token is signed with an unknown key")
+                decoded = _session_jwt.decode(token, key, claims_options=_CLAIMS_OPTIONS)
+                decoded.validate(leeway=_CLAIMS_LEEWAY)
+                _claims_cache.put(token, decoded)
             self.is_signed_in = True
             self.claims = decoded
-            self.user_id = decoded.get('sub')
+            self.user_id = decoded['sub']
 
-            if self._fetch_user:
-                self.fetch_user()
+            if ClerkState._fetch_user:
+                user = _cached_user(self.user_id)
+                if user is not None:
+                    self.set_user(user)
+                else:
+                    yield ClerkState.fetch_user
 
         except JoseError as e:
             self.auth_error = e
-            logging.warning(f"Auth error: {e}")
+            logger.warning("Auth error: %s", e)
 
     def clear_clerk_session(self):
         """
@@ -218,7 +535,7 @@ class ClerkState(rx.State):
         """
         self.auth_error = None
 
-    def fetch_user(self):
+    async def fetch_user(self):
         """
         Fetches ClerkState.user from the clerk backend API, using
         ClerkState.user_id.  Use this Reflex event if you want to force
@@ -226,7 +543,9 @@ class ClerkState(rx.State):
         their account profile).
         """
         if self.user_id:
-            user = self.clerk_api_client.get_user(self.user_id)
+            # Always goes to Clerk, rather than the short-lived cache set_clerk_session
+            # uses, as this is how apps pick up changes to the user.
+            user = await _get_user(self.user_id)
             self.set_user(user)
 
 
@@ -236,7 +555,7 @@ class ClerkSessionSynchronizer(rx.Component):
 
     def add_imports(self) -> dict[str, Union[str, ImportVar, list[Union[str, ImportVar]]]]:
         addl_imports = {
-            "@clerk/clerk-react": ["useAuth"],
+            CLERK_LIBRARY: ["useAuth"],
             "react": ["useContext", "useEffect"],
             "/utils/context": ["EventLoopContext"],
             "/utils/state": ["Event"]
@@ -272,11 +591,39 @@ function ClerkSessionSynchronizer({ children }) {
         ]
 
 
-class ClerkProvider(rx.Component):
-    """ClerkProvider component."""
+@functools.lru_cache(maxsize=1)
+def _resolve_keys(secret_key: typing.Optional[str],
+                  publishable_key: typing.Optional[str]) -> typing.Tuple[str, str]:
+    """
+    Returns the secret and publishable keys to use for a ClerkProvider, falling back
+    to the environment for any that weren't passed in.  Memoized, as the provider is
+    usually created with the same arguments for every page.
+    """
+    # Check that at this point we have a secret key either passed as a
+    # prop or set as an environment variable.
+    secret_key = secret_key or ClerkState.secret_key
+    if not secret_key:
+        raise ValueError(
+            "ClerkProvider requires a secret_key.  You can set this by passing "
+            "it as a keyword argument to the clerk_provider component or by "
+            "setting the CLERK_SECRET_KEY environment variable.\n\nThis can "
+            "be found in your Clerk Dashboard on the API Keys page:\n"
+            "https://dashboard.clerk.com/last-active?path=api-keys")
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
+    publishable_key = publishable_key or os.environ.get('CLERK_PUBLISHABLE_KEY')
+    if not publishable_key:
+        raise ValueError(
+            "ClerkProvider requires a publishable_key.  You can set this by passing "
+            "it as a keyword argument to the clerk_provider component or by "
+            "setting the CLERK_PUBLISHABLE_KEY environment variable.\n\nThis can "
+            "be found in your Clerk Dashboard on the API Keys page:\n"
+            "https://dashboard.clerk.com/last-active?path=api-keys")
+
+    return secret_key, publishable_key
+
+
+class ClerkProvider(ClerkComponent):
+    """ClerkProvider component."""
 
     # The React component tag.
     tag = "ClerkProvider"
@@ -392,30 +739,8 @@ class ClerkProvider(rx.Component):
     def create(cls, *children, **props) -> 'ClerkProvider':
         # Copy secret key to ClerkState, then remove it from the props to
         # avoid passing it to the client.
-        if props.get('secret_key'):
-            ClerkState._secret_key = props['secret_key']
-            del props['secret_key']
-
-        # Check that at this point we have a secret key either passed as a
-        # prop or set as an environment variable.
-        if not ClerkState.secret_key:
-            raise ValueError(
-                "ClerkProvider requires a secret_key.  You can set this by passing "
-                "it as a keyword argument to the clerk_provider component or by "
-                "setting the CLERK_SECRET_KEY environment variable.\n\nThis can "
-                "be found in your Clerk Dashboard on the API Keys page:\n"
-                "https://dashboard.clerk.com/last-active?path=api-keys")
-
-        if not props.get('publishable_key'):
-            props['publishable_key'] = os.environ.get('CLERK_PUBLISHABLE_KEY')
-
-        if not props['publishable_key']:
-            raise ValueError(
-                "ClerkProvider requires a publishable_key.  You can set this by passing "
-                "it as a keyword argument to the clerk_provider component or by "
-                "setting the CLERK_PUBLISHABLE_KEY environment variable.\n\nThis can "
-                "be found in your Clerk Dashboard on the API Keys page:\n"
-                "https://dashboard.clerk.com/last-active?path=api-keys")
+        ClerkState._secret_key, props['publishable_key'] = _resolve_keys(
+            props.pop('secret_key', None), props.get('publishable_key'))
 
         # Create a synchronizer and wrap it in a ClerkProvider.
         synchronizer = ClerkSessionSynchronizer.create(*children)
@@ -3,45 +3,55 @@ import typing
 from typing import Union
 
 import reflex as rx
+from pydantic.v1 import PrivateAttr
 from reflex import ImportVar
 from reflex.utils.serializers import serializer
 
+from .clerk_component import CLERK_LIBRARY, ClerkComponent, create_component
+
 
 class Javascript(str):
-    pass
+    __slots__ = ()
 
 
 @serializer
 def serialize_javascript(obj: Javascript) -> str:
-    return f"{{{obj}}}"
+    return "{" + obj + "}"
 
 
-class ClerkLoaded(rx.Component):
-    """ClerkLoaded component."""
+class _MemoizedComponent(rx.Component):
+    """
+    A Clerk component that takes no props, rendered through React.memo so that it isn't
+    re-rendered every time its parent is.  Subclasses set the tag, and the alias to
+    render the memoized component under.
+    """
+
+    # There is no library set, as the component is imported here instead, and rendered
+    # as its memoized alias.
+    def add_imports(self) -> dict[str, Union[str, ImportVar, list[Union[str, ImportVar]]]]:
+        return {CLERK_LIBRARY: ImportVar(tag=self.tag), "react": ImportVar(tag="memo")}
+
+    def add_custom_code(self) -> list[str]:
+        return [f"const {self.alias} = memo({self.tag})"]
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
+
+class ClerkLoaded(ClerkComponent):
+    """ClerkLoaded component."""
 
     # The React component tag.
     tag = "ClerkLoaded"
 
 
-class ClerkLoading(rx.Component):
+class ClerkLoading(ClerkComponent):
     """ClerkLoading component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "ClerkLoading"
 
 
-class Protect(rx.Component):
+class Protect(ClerkComponent):
     """Protect component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "Protect"
 
@@ -66,119 +76,116 @@ class Protect(rx.Component):
     Optional string corresponding to an Organization's Role in the format org:<role>
     """
 
+    # The fallback the imports were collected from, and its imports; walking the fallback
+    # subtree is only redone if the fallback is replaced.
+    _fallback_imports: typing.Optional[tuple] = PrivateAttr(default=None)
+
     # Make sure imports for the fallback component are included in the dependencies.
     def add_imports(self) -> dict[str, Union[str, ImportVar, list[Union[str, ImportVar]]]]:
-        if isinstance(self.fallback, rx.Component):
-            return self.fallback._get_all_imports()
-        return {}
+        if not isinstance(self.fallback, rx.Component):
+            return {}
+        if self._fallback_imports is None or self._fallback_imports[0] is not self.fallback:
+            self._fallback_imports = (self.fallback, self.fallback._get_all_imports())
+        return self._fallback_imports[1]
 
 
-class MultisessionAppSupport(rx.Component):
+class MultisessionAppSupport(ClerkComponent):
     """
     The <MultisessionAppSupport> provides a wrapper for your React application
     that guarantees a full rerendering cycle everytime the current session and
     user changes.
     """
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "MultisessionAppSupport"
 
 
-class RedirectToSignIn(rx.Component):
+class RedirectToSignIn(_MemoizedComponent):
     """
     The <RedirectToSignIn /> component will navigate to the sign in URL which has
     been configured in your application instance. The behavior will be just like a
     server-side (3xx) redirect, and will override the current location in the history
     stack.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "RedirectToSignIn"
 
+    # The name of the memoized component.
+    alias = "MemoRedirectToSignIn"
+
 
-class RedirectToSignUp(rx.Component):
+class RedirectToSignUp(_MemoizedComponent):
     """
     The <RedirectToSignUp /> component will navigate to the sign in URL which has
     been configured in your application instance. The behavior will be just like a
     server-side (3xx) redirect, and will override the current location in the history
     stack.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "RedirectToSignUp"
 
+    # The name of the memoized component.
+    alias = "MemoRedirectToSignUp"
 
-class RedirectToUserProfile(rx.Component):
+
+class RedirectToUserProfile(_MemoizedComponent):
     """
     The <RedirectToUserProfile /> component will navigate to the sign in URL which has
     been configured in your application instance. The behavior will be just like a
     server-side (3xx) redirect, and will override the current location in the history
     stack.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "RedirectToUserProfile"
 
+    # The name of the memoized component.
+    alias = "MemoRedirectToUserProfile"
+
 
-class RedirectToOrganizationProfile(rx.Component):
+class RedirectToOrganizationProfile(_MemoizedComponent):
     """
     The <RedirectToOrganizationProfile /> component will navigate to the sign in URL which has
     been configured in your application instance. The behavior will be just like a
     server-side (3xx) redirect, and will override the current location in the history
     stack.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "RedirectToOrganizationProfile"
 
+    # The name of the memoized component.
+    alias = "MemoRedirectToOrganizationProfile"
+
 
-class RedirectToCreateOrganization(rx.Component):
+class RedirectToCreateOrganization(_MemoizedComponent):
     """
     The <RedirectToCreateOrganization /> component will navigate to the sign in URL which has
     been configured in your application instance. The behavior will be just like a
     server-side (3xx) redirect, and will override the current location in the history
     stack.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "RedirectToCreateOrganization"
 
+    # The name of the memoized component.
+    alias = "MemoRedirectToCreateOrganization"
 
-class SignedIn(rx.Component):
+
+class SignedIn(ClerkComponent):
     """
     The <SignedIn> component offers authentication checks as a cross-cutting concern. Any
     children components wrapped by a <SignedIn> component will be rendered only if there's
     a User with an active Session signed in your application.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "SignedIn"
 
 
-class SignedOut(rx.Component):
+class SignedOut(ClerkComponent):
     """
     The <SignedOut> component offers authentication checks as a cross-cutting concern. Any
     children components wrapped by a <SignedOut> component will be rendered only if there's
     a User with an active Session signed in your application.
     """
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "SignedOut"
 
@@ -229,7 +236,8 @@ def protect(
     Returns:
         A Protect component instance that can be rendered.
     """
-    return Protect.create(
+    return create_component(
+        Protect,
         *children,
         condition=condition,
         fallback=fallback,
@@ -5,29 +5,34 @@ import reflex as rx
 from reflex.utils.serializers import serializer
 
 from .appearance import Appearance
+from .clerk_component import ClerkComponent, create_component
 
 
 class SignInInitialValues:
-    email_address: str = None
-    username: str = None
-    phone_number: str = None
+    __slots__ = ("email_address", "username", "phone_number")
+
+    def __init__(self, email_address: str = None, username: str = None, phone_number: str = None):
+        self.email_address = email_address
+        self.username = username
+        self.phone_number = phone_number
 
 
 @serializer
 def serialize_sign_in_initial_values(obj: SignInInitialValues) -> dict:
-    return {
-        "emailAddress": obj.email_address,
-        "username": obj.username,
-        "phoneNumber": obj.phone_number,
-    }
-
-
-class SignIn(rx.Component):
+    # Unset fields are left out rather than sent as nulls.
+    values = {}
+    if obj.email_address is not None:
+        values["emailAddress"] = obj.email_address
+    if obj.username is not None:
+        values["username"] = obj.username
+    if obj.phone_number is not None:
+        values["phoneNumber"] = obj.phone_number
+    return values
+
+
+class SignIn(ClerkComponent):
     """SignIn component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "SignIn"
 
@@ -88,12 +93,9 @@ class SignIn(rx.Component):
     """The values used to prefill the sign-in fields with."""
 
 
-class SignInButton(rx.Component):
+class SignInButton(ClerkComponent):
     """SignInButton component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "SignInButton"
 
@@ -175,7 +177,8 @@ def sign_in_button(
     Returns:
         A SignInButton component instance that can be rendered.
     """
-    return SignInButton.create(
+    return create_component(
+        SignInButton,
         *children,
         force_redirect_url=force_redirect_url,
         fallback_redirect_url=fallback_redirect_url,
@@ -234,7 +237,8 @@ def sign_in(
     Returns:
         A SignIn component instance that can be rendered.
     """
-    return SignIn.create(
+    return create_component(
+        SignIn,
         *children,
         appearance=appearance,
         routing=routing,
@@ -3,32 +3,37 @@
 import reflex as rx
 from reflex.utils.serializers import serializer
 
+from .clerk_component import ClerkComponent, create_component
+
 
 class SignOutOptions:
-    session_id: str = None
-    """
-    The ID of a specific session to sign out of. Useful for multi-session applications.
-    """
-    redirect_url: str = None
-    """
-    The redirect URL to navigate to after sign out is complete.
-    """
+    __slots__ = ("session_id", "redirect_url")
+
+    def __init__(self, session_id: str = None, redirect_url: str = None):
+        """
+        Args:
+            session_id: The ID of a specific session to sign out of. Useful for
+                multi-session applications.
+            redirect_url: The redirect URL to navigate to after sign out is complete.
+        """
+        self.session_id = session_id
+        self.redirect_url = redirect_url
 
 
 @serializer
 def serialize_sign_out_options(obj: SignOutOptions) -> dict:
-    return {
-        "sessionId": obj.session_id,
-        "redirectUrl": obj.redirect_url,
-    }
+    # Unset options are left out rather than sent as nulls.
+    options = {}
+    if obj.session_id is not None:
+        options["sessionId"] = obj.session_id
+    if obj.redirect_url is not None:
+        options["redirectUrl"] = obj.redirect_url
+    return options
 
 
-class SignOutButton(rx.Component):
+class SignOutButton(ClerkComponent):
     """SignOutButton component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "SignOutButton"
 
@@ -75,7 +80,8 @@ def sign_out_button(
     Returns:
         A SignOutButton component instance that can be rendered.
     """
-    return SignOutButton.create(
+    return create_component(
+        SignOutButton,
         *children,
         options=options,
         redirect_url=redirect_url
@@ -1,62 +1,41 @@
-"""Reflex custom component SignIn."""
+"""Reflex custom component SignUp."""
+import dataclasses
 import typing
 
 import reflex as rx
 from reflex.utils.serializers import serializer
 
 from .appearance import Appearance
+from .clerk_component import ClerkComponent, create_component
 
 
+@dataclasses.dataclass(frozen=True)
 class SignUpInitialValues:
-    email_address: str = None
-    username: str = None
-    phone_number: str = None
-    first_name: str = None
-    last_name: str = None
+    email_address: typing.Optional[str] = None
+    username: typing.Optional[str] = None
+    phone_number: typing.Optional[str] = None
+    first_name: typing.Optional[str] = None
+    last_name: typing.Optional[str] = None
 
 
-@serializer
-def serialize_sign_up_initial_values(obj: SignUpInitialValues) -> dict:
-    return {
-        "emailAddress": obj.email_address,
-        "username": obj.username,
-        "phoneNumber": obj.phone_number,
-        "firstName": obj.first_name,
-        "lastName": obj.last_name,
-    }
-
-
-class SignUp(rx.Component):
-    """ClerkProvider component."""
-
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
+# The SignUpInitialValues attributes, and the names Clerk expects them under.
+_SIGNUP_FIELDS = (
+    ("email_address", "emailAddress"),
+    ("username", "username"),
+    ("phone_number", "phoneNumber"),
+    ("first_name", "firstName"),
+    ("last_name", "lastName"),
+)
 
-    # The React component tag.
-    tag = "SignIn"
 
-    appearance: Appearance = None
-    """Optional object to style your components. Will only affect Clerk Components and not Account Portal pages."""
-
-    routing: typing.Literal['hash', 'path', 'virtual'] = None
-    """The routing strategy for your pages.
-    
-    Defaults to 'path' in Next.js and Remix applications. Defaults to hash for all other SDK's.
-    """
-
-    path: str = None
-    """
-    The path where the component is mounted on when routing is set to path.
-    It is ignored in hash- and virtual-based routing.
+@serializer
+def serialize_sign_up_initial_values(obj: SignUpInitialValues) -> dict:
+    # Unset fields are left out rather than sent as nulls.
+    return {key: value for attr, key in _SIGNUP_FIELDS if (value := getattr(obj, attr)) is not None}
 
-    For example: /sign-up.
-    """
 
-    sign_in_url: str = None
-    """
-    Full URL or path to the sign in page. Use this property to provide the target of the 
-    'Sign In' link that's rendered. It's recommended to use the environment variable instead.
-    """
+class RedirectUrlsMixin(ClerkComponent):
+    """The redirect URL props shared by SignUp and SignUpButton."""
 
     force_redirect_url: str = None
     """
@@ -86,47 +65,46 @@ class SignUp(rx.Component):
     and redirect_url. It's recommended to use the environment variable instead.
     """
 
-    initial_values: typing.Optional[SignUpInitialValues] = None
-    """The values used to prefill the sign-in fields with."""
-
 
-class SignUpButton(rx.Component):
-    """SignUpButton component."""
+class SignUp(RedirectUrlsMixin):
+    """SignUp component."""
 
-    library = "@clerk/clerk-react"
-    """The React library to wrap."""
+    # The React component tag.
+    tag = "SignUp"
 
-    tag = "SignUpButton"
-    """The React component tag."""
+    appearance: Appearance = None
+    """Optional object to style your components. Will only affect Clerk Components and not Account Portal pages."""
 
-    force_redirect_url: str = None
-    """
-    If provided, this URL will always be redirected to after the user signs in. Takes priority
-    over deprecated props such as after_sign_in_url and redirect_url. It's recommended to use
-    the environment variable instead.
+    routing: typing.Literal['hash', 'path', 'virtual'] = None
+    """The routing strategy for your pages.
+    
+    Defaults to 'path' in Next.js and Remix applications. Defaults to hash for all other SDK's.
     """
 
-    fallback_redirect_url: str = None
-    """
-    The fallback URL to redirect to after the user signs in, if there's no redirect_url in the
-    path already. Defaults to /. Takes priority over deprecated props such as after_sign_in_url
-    and redirect_url. It's recommended to use the environment variable instead.
+    path: str = None
     """
+    The path where the component is mounted on when routing is set to path.
+    It is ignored in hash- and virtual-based routing.
 
-    sign_in_force_redirect_url: str = None
-    """
-    If provided, this URL will always be redirected to after the user signs up. Takes priority
-    over deprecated props such as after_sign_up_url and redirect_url. It's recommended to use the
-    environment variable instead.
+    For example: /sign-up.
     """
 
-    sign_in_fallback_redirect_url: str = None
+    sign_in_url: str = None
     """
-    The fallback URL to redirect to after the user signs up, if there's no redirect_url in the 
-    path already. Defaults to /. Takes priority over deprecated props such as after_sign_up_url
-    and redirect_url. It's recommended to use the environment variable instead.
+    Full URL or path to the sign in page. Use this property to provide the target of the 
+    'Sign In' link that's rendered. It's recommended to use the environment variable instead.
     """
 
+    initial_values: typing.Optional[SignUpInitialValues] = None
+    """The values used to prefill the sign-in fields with."""
+
+
+class SignUpButton(RedirectUrlsMixin):
+    """SignUpButton component."""
+
+    tag = "SignUpButton"
+    """The React component tag."""
+
     mode: typing.Literal['redirect', 'modal'] = None
     """
     Determines what happens when a user clicks on the <SignInButton>. Setting this to 'redirect'
@@ -177,7 +155,8 @@ def sign_up_button(
     Returns:
         A SignUpButton component instance that can be rendered.
     """
-    return SignUpButton.create(
+    return create_component(
+        SignUpButton,
         *children,
         force_redirect_url=force_redirect_url,
         fallback_redirect_url=fallback_redirect_url,
@@ -236,7 +215,11 @@ def sign_up(
     Returns:
         A SignUp component instance that can be rendered.
     """
-    return SignUp.create(
+    # With no field set there is nothing to prefill, so leave the prop out entirely.
+    if isinstance(initial_values, SignUpInitialValues) and initial_values == SignUpInitialValues():
+        initial_values = None
+    return create_component(
+        SignUp,
         *children,
         appearance=appearance,
         routing=routing,
@@ -4,14 +4,12 @@ import typing
 import reflex as rx
 
 from .appearance import Appearance
+from .clerk_component import ClerkComponent, create_component
 
 
-class UserButton(rx.Component):
+class UserButton(ClerkComponent):
     """UserButton component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "UserButton"
 
@@ -73,12 +71,9 @@ class UserButton(rx.Component):
     """
 
 
-class UserProfile(rx.Component):
+class UserProfile(ClerkComponent):
     """UserProfile component."""
 
-    # The React library to wrap.
-    library = "@clerk/clerk-react"
-
     # The React component tag.
     tag = "UserProfile"
 
@@ -142,7 +137,8 @@ def user_button(
     Returns:
         A UserButton component instance that can be rendered.
     """
-    return UserButton.create(
+    return create_component(
+        UserButton,
         *children,
         appearance=appearance,
         show_name=show_name,
@@ -187,7 +183,8 @@ def user_profile(
     Returns:
         A UserProfile component instance that can be rendered.
     """
-    return UserProfile.create(
+    return create_component(
+        UserProfile,
         *children,
         appearance=appearance,
         additional_oauth_scopes=additional_oauth_scopes
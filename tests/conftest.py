@@ -0,0 +1,39 @@
+import time
+
+import pytest
+from authlib.jose import JsonWebKey, jwt
+
+import reflex as rx
+from reflex_clerk.lib import clerk_provider
+
+SIGNING_KEY = JsonWebKey.generate_key("RSA", 2048, {"kid": "test-key"}, is_private=True)
+
+
+def make_token(**claims) -> str:
+    """Returns a session token signed with SIGNING_KEY; pass a claim as None to leave it out."""
+    now = int(time.time())
+    payload = {"sub": "user_1", "exp": now + 60, "iat": now, **claims}
+    payload = {name: value for name, value in payload.items() if value is not None}
+    return jwt.encode({"alg": "RS256", "kid": "test-key"}, payload, SIGNING_KEY).decode()
+
+
+def new_clerk_state() -> clerk_provider.ClerkState:
+    root = rx.State(_reflex_internal_init=True)
+    return root.get_substate(clerk_provider.ClerkState.get_full_name().split(".")[1:])
+
+
+async def set_clerk_session(state: clerk_provider.ClerkState, token: str) -> list:
+    """Runs the set_clerk_session event handler, returning the events it yields."""
+    handler = clerk_provider.ClerkState.event_handlers["set_clerk_session"].fn
+    return [event async for event in handler(state, token)]
+
+
+@pytest.fixture(autouse=True)
+def clerk_provider_state(monkeypatch):
+    """Gives each test empty module-level caches, and the test signing key as the JWKS."""
+    public_key = dict(SIGNING_KEY.as_dict(is_private=False), kid="test-key", use="sig")
+    monkeypatch.setattr(clerk_provider, "_jwks", clerk_provider._JwksCache.parse([public_key]))
+    monkeypatch.setattr(clerk_provider, "_claims_cache", clerk_provider._ClaimsCache())
+    monkeypatch.setattr(clerk_provider, "_user_cache", {})
+    monkeypatch.setattr(clerk_provider, "_user_fetches", {})
+    monkeypatch.setattr(clerk_provider.ClerkState, "_fetch_user", False)
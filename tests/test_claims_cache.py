@@ -0,0 +1,62 @@
+import asyncio
+
+from authlib.jose import JWTClaims
+
+from reflex_clerk.lib import clerk_provider
+from reflex_clerk.lib.clerk_provider import _ClaimsCache
+
+from conftest import make_token, new_clerk_state, set_clerk_session
+
+
+def claims(**values) -> JWTClaims:
+    return JWTClaims(values, {"alg": "RS256"})
+
+
+def test_hit_before_exp(monkeypatch):
+    monkeypatch.setattr(clerk_provider.time, "time", lambda: 1000.0)
+    cache = _ClaimsCache()
+    cached = claims(sub="user_1", exp=1001)
+    cache.put("token", cached)
+    assert cache.get("token") is cached
+
+
+def test_expires_at_exp(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(clerk_provider.time, "time", lambda: now[0])
+    cache = _ClaimsCache()
+    cache.put("token", claims(sub="user_1", exp=1010))
+    now[0] = 1010.0
+    assert cache.get("token") is None
+    # Dropped rather than kept around, so it is a miss even if the clock goes back.
+    now[0] = 1000.0
+    assert cache.get("token") is None
+
+
+def test_claims_without_exp_are_not_cached():
+    cache = _ClaimsCache()
+    cache.put("token", claims(sub="user_1"))
+    assert cache.get("token") is None
+
+
+def test_evicts_least_recently_used():
+    cache = _ClaimsCache(maxsize=2)
+    for token in ("a", "b"):
+        cache.put(token, claims(sub=token, exp=2 ** 40))
+    cache.get("a")
+    cache.put("c", claims(sub="c", exp=2 ** 40))
+    assert cache.get("b") is None
+    assert cache.get("a")["sub"] == "a"
+    assert cache.get("c")["sub"] == "c"
+
+
+def test_set_clerk_session_reuses_verified_claims(monkeypatch):
+    token = make_token()
+    asyncio.run(set_clerk_session(new_clerk_state(), token))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token verified again")
+
+    monkeypatch.setattr(clerk_provider._session_jwt, "decode", fail)
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, token))
+    assert state.is_signed_in and state.user_id == "user_1"
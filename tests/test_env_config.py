@@ -0,0 +1,40 @@
+import pytest
+
+from reflex_clerk.lib import clerk_provider
+
+
+@pytest.fixture(autouse=True)
+def unset_env(monkeypatch):
+    monkeypatch.delenv("CLERK_SECRET_KEY", raising=False)
+    monkeypatch.delenv("CLERK_JWT_PUBLIC_KEYS", raising=False)
+    monkeypatch.setattr(clerk_provider.ClerkState, "_secret_key", None)
+    clerk_provider._secret_key_from_env.cache_clear()
+    clerk_provider._jwt_public_keys_from_env.cache_clear()
+    yield
+    clerk_provider._secret_key_from_env.cache_clear()
+    clerk_provider._jwt_public_keys_from_env.cache_clear()
+
+
+def test_secret_key_set_after_first_read(monkeypatch):
+    assert clerk_provider.ClerkState.secret_key is None
+    assert clerk_provider.ClerkState._secret_key is None
+
+    monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_late")
+    assert clerk_provider.ClerkState.secret_key == "sk_test_late"
+
+    # Cached once found.
+    monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_other")
+    assert clerk_provider.ClerkState.secret_key == "sk_test_late"
+
+
+def test_jwt_public_keys_set_after_first_read(monkeypatch):
+    assert clerk_provider._jwt_public_keys_from_env() == []
+
+    monkeypatch.setenv("CLERK_JWT_PUBLIC_KEYS", '[{"kty": "RSA", "kid": "ins_1"}]')
+    assert clerk_provider._jwt_public_keys_from_env() == [{"kty": "RSA", "kid": "ins_1"}]
+
+
+def test_provider_picks_up_secret_key_set_after_import(monkeypatch):
+    clerk_provider._resolve_keys.cache_clear()
+    monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_late")
+    assert clerk_provider._resolve_keys(None, "pk_test") == ("sk_test_late", "pk_test")
@@ -0,0 +1,70 @@
+import httpx
+import pytest
+
+from reflex_clerk.clerk_client import clerk_client
+from reflex_clerk.clerk_client.clerk_request_models import GetUserListParams
+
+USER = {
+    "id": "user_1", "object": "user", "first_name": "Ada", "last_name": None, "image_url": "https://img/1",
+    "has_image": True, "public_metadata": {"plan": "pro"}, "unsafe_metadata": {},
+    "email_addresses": [{"id": "idn_1", "email_address": "ada@example.com"}], "phone_numbers": [],
+    "web3_wallets": [], "saml_accounts": [], "password_enabled": True, "two_factor_enabled": False,
+    "totp_enabled": False, "backup_code_enabled": False, "banned": False, "locked": False,
+}
+CLIENT = {"id": "client_1", "object": "client", "created_at": 1, "updated_at": 2, "session_ids": ["sess_1"]}
+META = {"total_count": 1, "limit": 10, "offset": 0}
+
+
+@pytest.fixture(params=["orjson", "simdjson"])
+def client(request, monkeypatch) -> clerk_client.ClerkAPIClient:
+    if request.param == "simdjson":
+        monkeypatch.setattr(clerk_client, "simdjson", pytest.importorskip("simdjson"))
+    else:
+        monkeypatch.setattr(clerk_client, "simdjson", None)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = USER if request.url.path.endswith("/users") else CLIENT
+        return httpx.Response(200, json={"data": [item], "meta": META})
+
+    client = clerk_client.ClerkAPIClient(clerk_client.BASE_URL, "sk_test")
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_user_list_selected_fields(client):
+    response = client.get_user_list(GetUserListParams(limit=10), fields=["id", "first_name", "last_name"])
+    user, = response.data
+    assert (user.id, user.first_name, user.last_name) == ("user_1", "Ada", None)
+    assert user.model_fields_set == {"id", "first_name", "last_name"}
+    assert response.meta.total_count == 1
+
+
+def test_user_list_unselected_fields_are_none(client):
+    user, = client.get_user_list(fields=["id", "first_name"]).data
+    # Fields with a default get it; required ones (object, has_image, ...) are None too.
+    assert user.image_url is None
+    assert user.object is None
+    assert user.has_image is None
+    assert user.public_metadata is None
+    assert user.email_addresses is None
+    assert "image_url" not in user.model_fields_set
+
+
+def test_user_list_nested_values_are_plain(client):
+    user, = client.get_user_list(fields=["id", "public_metadata", "email_addresses"]).data
+    assert user.public_metadata == {"plan": "pro"}
+    assert user.email_addresses == [{"id": "idn_1", "email_address": "ada@example.com"}]
+
+
+def test_user_list_selected_field_missing_from_response(client):
+    user, = client.get_user_list(fields=["id", "username"]).data
+    assert user.username is None
+    assert user.model_fields_set == {"id"}
+
+
+def test_client_list_selected_fields(client):
+    item, = client.get_client_list(fields=["id", "session_ids"]).data
+    assert (item.id, item.session_ids) == ("client_1", ["sess_1"])
+    assert item.created_at is None
+    assert item.status is None
+    assert item.model_fields_set == {"id", "session_ids"}
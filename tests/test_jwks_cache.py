@@ -0,0 +1,113 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from reflex_clerk.clerk_client import clerk_client
+
+KEY = {"kty": "RSA", "use": "sig", "kid": "ins_1", "n": "sXch", "e": "AQAB"}
+ROTATED_KEY = dict(KEY, kid="ins_2")
+
+
+class FakeClerk(object):
+    """Serves /jwks, answering requests that carry the current ETag with a 304."""
+
+    def __init__(self):
+        self.keys = [KEY]
+        self.etag = '"v1"'
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, json={"keys": self.keys}, headers={"ETag": self.etag})
+
+
+@pytest.fixture
+def clerk() -> FakeClerk:
+    return FakeClerk()
+
+
+@pytest.fixture
+def client(clerk) -> clerk_client.ClerkAPIClient:
+    client = clerk_client.ClerkAPIClient(clerk_client.BASE_URL, "sk_test")
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(clerk))
+    return client
+
+
+def age(client: clerk_client.ClerkAPIClient, seconds: float) -> None:
+    """Makes the cached key set look `seconds` older than it is."""
+    client._jwks_cache = client._jwks_cache._replace(fetched_at=client._jwks_cache.fetched_at - seconds)
+
+
+def test_served_from_memory_within_ttl(client, clerk):
+    assert client.get_jwks_raw() == [KEY]
+    assert client.get_jwks().keys[0].kid == "ins_1"
+    assert len(clerk.requests) == 1
+
+
+def test_revalidated_with_etag_after_ttl(client, clerk):
+    jwks = client.get_jwks()
+    age(client, client._jwks_ttl)
+
+    assert client.get_jwks() is jwks
+    assert len(clerk.requests) == 2
+    assert clerk.requests[1].headers["If-None-Match"] == '"v1"'
+
+    # The 304 restarts the TTL.
+    client.get_jwks()
+    assert len(clerk.requests) == 2
+
+
+def test_changed_key_set_replaces_cache(client, clerk):
+    client.get_jwks()
+    clerk.keys, clerk.etag = [KEY, ROTATED_KEY], '"v2"'
+    age(client, client._jwks_ttl)
+    assert client.get_jwks_raw() == [KEY, ROTATED_KEY]
+
+
+def test_forced_refresh_floor(client, clerk):
+    client.get_jwks()
+
+    # Fetched less than _jwks_min_refresh_interval ago: a forced refresh is skipped.
+    client.get_jwks(force_refresh=True)
+    assert len(clerk.requests) == 1
+
+    age(client, client._jwks_min_refresh_interval)
+    client.get_jwks(force_refresh=True)
+    assert len(clerk.requests) == 2
+
+
+def test_concurrent_refreshes_share_one_request(client, clerk):
+    client.get_jwks()
+    age(client, client._jwks_ttl)
+
+    barrier = threading.Barrier(8)
+
+    def refresh():
+        barrier.wait()
+        client.get_jwks()
+
+    threads = [threading.Thread(target=refresh) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(clerk.requests) == 2
+
+
+def test_async_client_revalidates_with_etag(clerk):
+    async def run():
+        client = clerk_client.AsyncClerkAPIClient(clerk_client.BASE_URL, "sk_test")
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(clerk))
+        jwks = await client.get_jwks()
+        age(client, client._jwks_ttl)
+        assert await client.get_jwks() is jwks
+        await client.get_jwks(force_refresh=True)
+        await client.aclose()
+
+    asyncio.run(run())
+    assert len(clerk.requests) == 2
+    assert clerk.requests[1].headers["If-None-Match"] == '"v1"'
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+from authlib.jose import JsonWebKey, jwt
+
+from reflex_clerk.lib import clerk_provider
+
+from conftest import SIGNING_KEY, new_clerk_state, set_clerk_session
+
+ROTATED_KEY = JsonWebKey.generate_key("RSA", 2048, {"kid": "rotated-key"}, is_private=True)
+UNKNOWN_KEY = JsonWebKey.generate_key("RSA", 2048, {"kid": "unknown-key"}, is_private=True)
+
+
+def public_jwk(key, kid: str) -> dict:
+    return dict(key.as_dict(is_private=False), kid=kid, use="sig")
+
+
+def rotated_token(key=ROTATED_KEY) -> str:
+    now = int(time.time())
+    return jwt.encode({"alg": "RS256", "kid": key.kid}, {"sub": "user_2", "exp": now + 60, "iat": now},
+                      key).decode()
+
+
+class FakeAsyncClient(object):
+    """Serves both keys from get_jwks_raw, once `released` is set."""
+
+    def __init__(self):
+        self.secret_key = "sk_test"
+        self.calls = []
+        self.released = asyncio.Event()
+
+    async def get_jwks_raw(self, force_refresh: bool = False):
+        self.calls.append(force_refresh)
+        await self.released.wait()
+        return [public_jwk(SIGNING_KEY, "test-key"), public_jwk(ROTATED_KEY, "rotated-key")]
+
+
+class FailingSyncClient(object):
+    secret_key = "sk_test"
+
+    def get_jwks_raw(self, force_refresh: bool = False):
+        raise AssertionError("the event handler fetched the JWKS synchronously")
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(clerk_provider.ClerkState, "_secret_key", "sk_test")
+    monkeypatch.setattr(clerk_provider, "_clerk_api_client", FailingSyncClient())
+    monkeypatch.setattr(clerk_provider, "_jwks_async_lock", None)
+    # The test key set was loaded long enough ago that a refresh is allowed.
+    monkeypatch.setattr(clerk_provider, "_jwks", clerk_provider._JwksCache.parse(
+        [public_jwk(SIGNING_KEY, "test-key")], time.monotonic() - clerk_provider._JWKS_MIN_REFRESH_INTERVAL))
+
+    def install():
+        client = FakeAsyncClient()
+        monkeypatch.setattr(clerk_provider, "_async_clerk_api_client", client)
+        return client
+
+    return install
+
+
+def test_unknown_kid_refreshes_without_blocking_the_event_loop(api):
+    async def run():
+        client = api()
+        state = new_clerk_state()
+        sign_in = asyncio.ensure_future(set_clerk_session(state, rotated_token()))
+        # The refresh is waiting on the API; other work on the loop still runs meanwhile.
+        await asyncio.sleep(0.01)
+        assert client.calls == [True] and not sign_in.done()
+        client.released.set()
+        await sign_in
+        return state
+
+    state = asyncio.run(run())
+    assert state.is_signed_in and state.user_id == "user_2"
+
+
+def test_concurrent_misses_share_one_refresh(api):
+    async def run():
+        client = api()
+        states = [new_clerk_state() for _ in range(5)]
+        sign_ins = asyncio.gather(*(set_clerk_session(state, rotated_token()) for state in states))
+        await asyncio.sleep(0.01)
+        client.released.set()
+        await sign_ins
+        return client, states
+
+    client, states = asyncio.run(run())
+    assert client.calls == [True]
+    assert all(state.is_signed_in for state in states)
+
+
+def test_refresh_is_throttled(api):
+    async def run():
+        client = api()
+        client.released.set()
+        await set_clerk_session(new_clerk_state(), rotated_token())
+        state = new_clerk_state()
+        await set_clerk_session(state, rotated_token(UNKNOWN_KEY))
+        return client, state
+
+    client, state = asyncio.run(run())
+    assert client.calls == [True]
+    assert not state.is_signed_in and "unknown key" in str(state.auth_error)
+
+
+def test_initial_load_uses_async_client(api, monkeypatch):
+    monkeypatch.setattr(clerk_provider, "_jwks", clerk_provider._JwksCache([], {}))
+
+    async def run():
+        client = api()
+        client.released.set()
+        state = new_clerk_state()
+        await set_clerk_session(state, rotated_token())
+        return client, state
+
+    client, state = asyncio.run(run())
+    assert client.calls == [False]
+    assert state.is_signed_in
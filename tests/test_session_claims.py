@@ -0,0 +1,81 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from authlib.jose import jwt
+from authlib.jose.errors import DecodeError, MissingClaimError, UnsupportedAlgorithmError
+
+from reflex_clerk.lib import clerk_provider
+
+from conftest import make_token, new_clerk_state, set_clerk_session
+
+
+def test_accepts_valid_token():
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, make_token()))
+    assert state.is_signed_in
+    assert state.user_id == "user_1"
+    assert state.auth_error is None
+
+
+@pytest.mark.parametrize("claim", ["sub", "exp", "iat"])
+def test_rejects_token_missing_claim(claim):
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, make_token(**{claim: None})))
+    assert not state.is_signed_in
+    assert state.user_id is None
+    assert isinstance(state.auth_error, MissingClaimError)
+    assert claim in str(state.auth_error)
+
+
+def test_rejected_token_is_not_cached():
+    token = make_token(sub=None)
+    asyncio.run(set_clerk_session(new_clerk_state(), token))
+    assert clerk_provider._claims_cache.get(token) is None
+
+
+def test_allows_clock_skew_within_leeway():
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, make_token(exp=int(time.time()) - clerk_provider._CLAIMS_LEEWAY // 2)))
+    assert state.is_signed_in
+
+
+def test_rejects_token_expired_beyond_leeway():
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, make_token(exp=int(time.time()) - 2 * clerk_provider._CLAIMS_LEEWAY)))
+    assert not state.is_signed_in
+    assert "expired" in str(state.auth_error)
+
+
+def encode_segment(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize("kid", [["test-key"], {"kid": "test-key"}, 1])
+def test_rejects_token_with_non_string_kid(kid):
+    token = ".".join([encode_segment({"alg": "RS256", "kid": kid}), encode_segment({"sub": "user_1"}), "sig"])
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, token))
+    assert not state.is_signed_in
+    assert isinstance(state.auth_error, DecodeError)
+
+
+def test_rejects_token_with_other_algorithm():
+    # An HS256 token naming the RSA key's id must not be checked against that key.
+    now = int(time.time())
+    token = jwt.encode({"alg": "HS256", "kid": "test-key"}, {"sub": "user_1", "exp": now + 60, "iat": now},
+                       b"secret").decode()
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, token))
+    assert not state.is_signed_in
+    assert isinstance(state.auth_error, UnsupportedAlgorithmError)
+
+
+@pytest.mark.parametrize("token", [None, 1, {"token": "x"}])
+def test_rejects_non_string_token(token):
+    state = new_clerk_state()
+    asyncio.run(set_clerk_session(state, token))
+    assert not state.is_signed_in
+    assert isinstance(state.auth_error, DecodeError)
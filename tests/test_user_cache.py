@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+from reflex_clerk.clerk_client.clerk_response_models import User
+from reflex_clerk.lib import clerk_provider
+
+from conftest import make_token, new_clerk_state, set_clerk_session
+
+
+def make_user(user_id: str) -> User:
+    return User.model_validate({
+        "id": user_id, "object": "user", "has_image": False, "public_metadata": {}, "unsafe_metadata": {},
+        "email_addresses": [], "phone_numbers": [], "web3_wallets": [], "saml_accounts": [],
+        "password_enabled": True, "two_factor_enabled": False, "totp_enabled": False,
+        "backup_code_enabled": False, "banned": False, "locked": False})
+
+
+class FakeAsyncClient(object):
+    def __init__(self):
+        self.secret_key = clerk_provider.ClerkState.secret_key
+        self.calls = []
+
+    async def get_user(self, user_id: str) -> User:
+        self.calls.append(user_id)
+        await asyncio.sleep(0.01)
+        return make_user(user_id)
+
+
+@pytest.fixture
+def api(monkeypatch) -> FakeAsyncClient:
+    client = FakeAsyncClient()
+    monkeypatch.setattr(clerk_provider, "_async_clerk_api_client", client)
+    return client
+
+
+def test_concurrent_fetches_share_one_request(api):
+    async def fetch_all():
+        return await asyncio.gather(*(clerk_provider._get_user("user_1") for _ in range(5)))
+
+    users = asyncio.run(fetch_all())
+    assert api.calls == ["user_1"]
+    assert all(user is users[0] for user in users)
+    assert not clerk_provider._user_fetches
+
+
+def test_cancelled_caller_does_not_cancel_shared_fetch(api):
+    async def fetch():
+        first = asyncio.ensure_future(clerk_provider._get_user("user_1"))
+        second = asyncio.ensure_future(clerk_provider._get_user("user_1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(fetch()).id == "user_1"
+    assert api.calls == ["user_1"]
+
+
+def test_cached_user_expires_after_ttl(api):
+    asyncio.run(clerk_provider._get_user("user_1"))
+    fetched_at, user = clerk_provider._user_cache["user_1"]
+    assert clerk_provider._cached_user("user_1") is user
+    clerk_provider._user_cache["user_1"] = (fetched_at - clerk_provider._USER_CACHE_TTL, user)
+    assert clerk_provider._cached_user("user_1") is None
+
+
+def test_cache_is_capped(api, monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(clerk_provider, "_user_cache", {
+        f"user_{i}": (now, make_user(f"user_{i}")) for i in range(clerk_provider._USER_CACHE_MAXSIZE)})
+
+    # Full of fresh entries: the new user is returned but not cached.
+    assert asyncio.run(clerk_provider._get_user("new_user")).id == "new_user"
+    assert len(clerk_provider._user_cache) == clerk_provider._USER_CACHE_MAXSIZE
+    assert "new_user" not in clerk_provider._user_cache
+
+    # Once the entries have gone stale they are dropped to make room.
+    stale = now - clerk_provider._USER_CACHE_TTL
+    for user_id, (_, user) in list(clerk_provider._user_cache.items()):
+        clerk_provider._user_cache[user_id] = (stale, user)
+    asyncio.run(clerk_provider._get_user("new_user"))
+    assert list(clerk_provider._user_cache) == ["new_user"]
+
+
+def test_sign_in_uses_cached_user(api, monkeypatch):
+    monkeypatch.setattr(clerk_provider.ClerkState, "_fetch_user", True)
+    token = make_token()
+
+    state = new_clerk_state()
+    assert asyncio.run(set_clerk_session(state, token)) == [clerk_provider.ClerkState.fetch_user]
+    asyncio.run(clerk_provider.ClerkState.event_handlers["fetch_user"].fn(state))
+    assert state.user.id == "user_1"
+
+    # A second tab signing in straight after gets the user without a follow-up fetch.
+    state = new_clerk_state()
+    assert asyncio.run(set_clerk_session(state, token)) == []
+    assert state.user.id == "user_1"
+    assert api.calls == ["user_1"]